@@ -5,32 +5,81 @@ This is the main file that starts the Flask server.
 It initializes the Flask app, configures CORS, and registers blueprints.
 
 To run the server:
-    python app.py
+    python app.py                                   (development)
+    gunicorn -c gunicorn.conf.py 'app:create_app()'  (production)
 
 The server will start at http://localhost:5000
 
 Available endpoints:
     - REST API: http://localhost:5000/posts
     - Health check: http://localhost:5000/health
+
+Optional features (turn off with environment variables):
+    ENABLE_GRAPHQL=0   REST-only server, Strawberry is never imported
+    ENABLE_SWAGGER=0   no Swagger UI at /api/docs
 """
 
-from flask import Flask, jsonify
+import os
+from typing import Optional
+
+import orjson
+from flask import Flask, Response
 from flask_cors import CORS
-from flask_swagger_ui import get_swaggerui_blueprint
 from rest_api import rest_api_bp
-from strawberry.flask.views import GraphQLView
-from graphql_api import schema
+from json_provider import ORJSONProvider
+
+
+# Bodies of the error responses, encoded once
+# They never change, so there is no need to build and encode a
+# dictionary again for every error
+_404_BODY = orjson.dumps({
+    'error': 'Endpoint not found',
+    'message': 'The requested URL was not found on the server'
+})
+_500_BODY = orjson.dumps({
+    'error': 'Internal server error',
+    'message': 'Something went wrong on the server'
+})
+
+
+def _env_flag(name: str, default: bool = True) -> bool:
+    """
+    Read an on/off switch from an environment variable.
+
+    "0", "false", "no" and "off" (any case) mean off, anything else means on.
+
+    Args:
+        name: Name of the environment variable
+        default: Value used when the variable is not set
+
+    Returns:
+        bool: Whether the feature is enabled
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+
+    return value.strip().lower() not in ('0', 'false', 'no', 'off')
 
 
-def create_app():
+def create_app(config: Optional[dict] = None):
     """
     Create and configure the Flask application.
 
     This function:
     1. Creates Flask app instance
-    2. Enables CORS for iOS app connectivity
-    3. Registers REST API blueprint
-    4. Adds error handlers
+    2. Switches JSON encoding to orjson (faster responses)
+    3. Enables CORS for iOS app connectivity
+    4. Registers REST API blueprint
+    5. Registers GraphQL and Swagger UI (if enabled)
+    6. Adds error handlers
+
+    GraphQL and Swagger UI are imported only when they are enabled, so a
+    REST-only server does not load Strawberry (and its schema) at all.
+
+    Args:
+        config: Optional settings that override the defaults, e.g.
+                {'ENABLE_GRAPHQL': False}
 
     Returns:
         Flask: Configured Flask application
@@ -38,6 +87,15 @@ def create_app():
     # Create Flask app
     app = Flask(__name__)
 
+    # Feature switches (environment variables first, then `config`)
+    app.config['ENABLE_GRAPHQL'] = _env_flag('ENABLE_GRAPHQL')
+    app.config['ENABLE_SWAGGER'] = _env_flag('ENABLE_SWAGGER')
+    if config:
+        app.config.update(config)
+
+    # Use orjson for every jsonify() call (much faster than the json module)
+    app.json = ORJSONProvider(app)
+
     # Enable CORS (Cross-Origin Resource Sharing)
     # This allows the iOS app to make requests to this server
     # In production, you should restrict this to specific origins
@@ -56,27 +114,66 @@ def create_app():
     # Register GraphQL endpoint
     # GraphQL playground will be available at /graphql in the browser
     # This enables both REST and GraphQL to run simultaneously
-    app.add_url_rule(
-        '/graphql',
-        view_func=GraphQLView.as_view(
-            'graphql_view',
-            schema=schema,
-            graphiql=True  # Enable GraphQL Playground for testing in browser
+    if app.config['ENABLE_GRAPHQL']:
+        # Imported here so REST-only servers skip building the schema
+        from graphql_api import schema, BlogGraphQLView, warm_introspection_cache
+
+        # Build the schema description once now instead of on every
+        # introspection request (e.g. each time GraphiQL is opened)
+        warm_introspection_cache()
+
+        app.add_url_rule(
+            '/graphql',
+            view_func=BlogGraphQLView.as_view(
+                'graphql_view',
+                schema=schema,
+                graphiql=True  # Enable GraphQL Playground for testing in browser
+            )
         )
-    )
 
     # Register Swagger UI
     # Swagger documentation will be available at /api/docs
-    SWAGGER_URL = '/api/docs'
-    API_URL = '/static/swagger.json'
-    swaggerui_blueprint = get_swaggerui_blueprint(
-        SWAGGER_URL,
-        API_URL,
-        config={
-            'app_name': "Blog REST API"
+    if app.config['ENABLE_SWAGGER']:
+        from flask_swagger_ui import get_swaggerui_blueprint
+
+        SWAGGER_URL = '/api/docs'
+        API_URL = '/static/swagger.json'
+        swaggerui_blueprint = get_swaggerui_blueprint(
+            SWAGGER_URL,
+            API_URL,
+            config={
+                'app_name': "Blog REST API"
+            }
+        )
+        app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
+
+    # Body of the root endpoint, built and encoded once here:
+    # nothing in it depends on the request
+    index_body = orjson.dumps({
+        'message': 'Blog API Server',
+        'version': '1.0.0',
+        'endpoints': {
+            'posts': '/posts',
+            'users': '/users',
+            'health': '/health',
+            'graphql': '/graphql'
+        },
+        'documentation': {
+            'swagger': 'http://localhost:5001/api/docs',
+            'rest_api': {
+                'posts': 'GET /posts?page=1&limit=10&sort=created_at&order=desc&search=keyword',
+                'single_post': 'GET /posts/<id>',
+                'users': 'GET /users',
+                'single_user': 'GET /users/<id>',
+                'user_posts': 'GET /users/<id>/posts?limit=3'
+            },
+            'graphql': {
+                'endpoint': 'POST /graphql',
+                'playground': 'Visit http://localhost:5001/graphql in browser',
+                'example_query': 'query { posts { data { id, title, author { name } } } }'
+            }
         }
-    )
-    app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
+    })
 
     # Root endpoint
     @app.route('/')
@@ -84,31 +181,7 @@ def create_app():
         """
         Root endpoint - API information
         """
-        return jsonify({
-            'message': 'Blog API Server',
-            'version': '1.0.0',
-            'endpoints': {
-                'posts': '/posts',
-                'users': '/users',
-                'health': '/health',
-                'graphql': '/graphql'
-            },
-            'documentation': {
-                'swagger': 'http://localhost:5001/api/docs',
-                'rest_api': {
-                    'posts': 'GET /posts?page=1&limit=10&sort=created_at&order=desc&search=keyword',
-                    'single_post': 'GET /posts/<id>',
-                    'users': 'GET /users',
-                    'single_user': 'GET /users/<id>',
-                    'user_posts': 'GET /users/<id>/posts?limit=3'
-                },
-                'graphql': {
-                    'endpoint': 'POST /graphql',
-                    'playground': 'Visit http://localhost:5001/graphql in browser',
-                    'example_query': 'query { posts { data { id, title, author { name } } } }'
-                }
-            }
-        }), 200
+        return Response(index_body, mimetype='application/json'), 200
 
     # Error handler for 404 (Not Found)
     @app.errorhandler(404)
@@ -116,10 +189,7 @@ def create_app():
         """
         Handle 404 errors with a JSON response
         """
-        return jsonify({
-            'error': 'Endpoint not found',
-            'message': 'The requested URL was not found on the server'
-        }), 404
+        return Response(_404_BODY, mimetype='application/json'), 404
 
     # Error handler for 500 (Internal Server Error)
     @app.errorhandler(500)
@@ -127,10 +197,7 @@ def create_app():
         """
         Handle 500 errors with a JSON response
         """
-        return jsonify({
-            'error': 'Internal server error',
-            'message': 'Something went wrong on the server'
-        }), 500
+        return Response(_500_BODY, mimetype='application/json'), 500
 
     return app
 
@@ -155,11 +222,14 @@ if __name__ == '__main__':
     print("  - Playground:  Open http://localhost:5001/graphql in browser")
     print("\nAPI Documentation:")
     print("  - Swagger UI:  http://localhost:5001/api/docs")
+    print("\nProduction Server:")
+    print("  - gunicorn -c gunicorn.conf.py 'app:create_app()'")
     print("\nPress CTRL+C to stop the server")
     print("=" * 70)
     print()
 
     # Run the Flask development server
+    # (for production use Gunicorn with gunicorn.conf.py instead)
     # debug=True enables auto-reload and better error messages
     # host='0.0.0.0' allows connections from other devices (iOS simulator)
     # port=5001 to avoid conflicts
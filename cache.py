@@ -0,0 +1,152 @@
+"""
+In-Memory Response Cache
+
+This module provides a small time-based cache for read-heavy database
+helpers. Post listings and users change far less often than they are read,
+so repeating the same query within a few seconds can be answered from
+memory instead of running the SQL again.
+
+Design principles:
+- No external service needed (no Redis server, everything stays local)
+- Entries expire after a fixed number of seconds (TTL)
+- A version number is part of every key: bumping it invalidates all
+  existing entries at once (call invalidate() after a write)
+- Hit/miss counters make it easy to check whether the cache helps
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+# How long cached results stay valid (in seconds)
+# Post listings get a short TTL, users change even less often
+POSTS_CACHE_TTL = 10
+USERS_CACHE_TTL = 60
+
+# Upper bound on stored entries, so that many different queries
+# (e.g. every possible search keyword) cannot grow memory forever
+MAX_CACHE_ENTRIES = 1024
+
+
+class TTLCache:
+    """
+    Thread-safe dictionary whose entries expire after `ttl` seconds.
+
+    Usage:
+        key = posts_cache.make_key(page, limit)
+        result = posts_cache.get(key)
+        if result is None:
+            result = run_query()
+            posts_cache.set(key, result)
+
+    Attributes:
+        ttl: Number of seconds an entry stays valid
+        version: Current version, included in every key
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that had to run the query
+    """
+
+    def __init__(self, ttl: float, max_entries: int = MAX_CACHE_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+        # key -> (expires_at, value)
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def make_key(self, *parts: Hashable) -> Tuple:
+        """
+        Build a cache key from the query parameters.
+
+        Args:
+            parts: Values that identify the query (page, limit, ...)
+
+        Returns:
+            Tuple starting with the current version
+        """
+        return (self.version,) + parts
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Key created by make_key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            return None
+
+    def set(self, key: Tuple, value: Any) -> None:
+        """
+        Store a value until the TTL expires.
+
+        Args:
+            key: Key created by make_key
+            value: Value to cache (treated as read-only by callers)
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._evict(now)
+
+            self._entries[key] = (now + self.ttl, value)
+
+    def invalidate(self) -> None:
+        """
+        Invalidate every cached entry by bumping the version.
+
+        Old entries can no longer be reached (their keys contain the old
+        version) and are dropped when the cache needs space.
+        """
+        with self._lock:
+            self.version += 1
+
+    def stats(self) -> dict:
+        """
+        Return hit/miss counters for monitoring.
+
+        Returns:
+            dict: Number of hits, misses and stored entries
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries)
+            }
+
+    def _evict(self, now: float) -> None:
+        """
+        Make room for a new entry (caller must hold the lock).
+
+        Expired or outdated entries are removed first. If the cache is
+        still full, the oldest entry is dropped.
+        """
+        for key in list(self._entries):
+            expires_at = self._entries[key][0]
+            if expires_at <= now or key[0] != self.version:
+                del self._entries[key]
+
+        if len(self._entries) >= self.max_entries:
+            oldest_key = next(iter(self._entries))
+            del self._entries[oldest_key]
+
+
+# Shared cache instances used by the database helpers
+posts_cache = TTLCache(ttl=POSTS_CACHE_TTL)
+users_cache = TTLCache(ttl=USERS_CACHE_TTL)
@@ -7,13 +7,24 @@ All database queries are centralized here for easy maintenance.
 Design principles:
 - Each function has a single, clear purpose
 - Functions return Python objects (User, Post) instead of raw database rows
+  (except the hot post listing, which returns rows plus posts_to_dicts)
 - SQL queries are readable and well-commented
 - Proper error handling for database operations
+- Connections are reused through a small pool instead of reopened per query
 """
 
+import atexit
+import base64
+import queue
+import re
 import sqlite3
-from typing import List, Optional, Tuple
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 from models import User, Post, PaginatedResponse
+from cache import posts_cache, users_cache
 import math
 
 
@@ -21,49 +32,217 @@ import math
 DATABASE_NAME = 'blog.db'
 
 
-def get_db_connection():
+# Number of connections kept open in the pool
+# Enough for the Flask dev server / a few worker threads to query in parallel
+POOL_SIZE = 8
+
+# Compiled statements kept per connection (Python's default is 128).
+# Large enough that every query in this module stays compiled.
+STATEMENT_CACHE_SIZE = 256
+
+# PRAGMAs applied to every pooled connection when it is opened
+# - journal_mode=WAL lets readers run while a writer is active. It is stored
+#   in the database file, so it only has to succeed once (see below)
+# - synchronous=NORMAL is safe with WAL and avoids an extra fsync per commit
+# The others only last as long as the connection, so every connection
+# sets them again:
+# - temp_store=MEMORY keeps sort/temporary tables off the disk
+# - mmap_size (512 MiB) lets SQLite read pages straight from the mapped file
+#   instead of copying them into its own cache
+# - cache_size (negative = KiB, here 64 MiB) keeps hot pages in memory
+# - foreign_keys=ON makes SQLite enforce posts.author_id -> users.id
+CONNECTION_PRAGMAS = '''
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=536870912;
+    PRAGMA cache_size=-65536;
+    PRAGMA foreign_keys=ON;
+'''
+
+# The pool itself is created lazily on first use (see _get_pool)
+_pool: Optional[queue.Queue] = None
+_pool_lock = threading.Lock()
+
+# Pools inherited from a parent process (see close_pool)
+_abandoned_pools: List[queue.Queue] = []
+
+
+def _create_connection() -> sqlite3.Connection:
     """
-    Create and return a database connection.
+    Open a new database connection configured for the pool.
 
     The connection is configured to return rows as sqlite3.Row objects,
     which allows us to access columns by name (like row['id']).
 
+    - check_same_thread=False: the connection is shared between threads
+      (only one thread uses it at a time, guaranteed by the pool)
+    - isolation_level=None: autocommit mode, we only run reads here
+    - cached_statements: how many compiled SQL statements are reused
+
     Returns:
         sqlite3.Connection: Database connection object
     """
-    connection = sqlite3.connect(DATABASE_NAME)
+    connection = sqlite3.connect(
+        DATABASE_NAME,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=STATEMENT_CACHE_SIZE
+    )
     connection.row_factory = sqlite3.Row  # Enable column access by name
+
+    # Switching to WAL reports the journal mode actually in use. It stays
+    # e.g. 'delete' if the database directory is read-only, in which case
+    # the app still works, just without concurrent readers and writers.
+    journal_mode = connection.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+    if journal_mode != 'wal':
+        warnings.warn(
+            f"SQLite is using journal_mode={journal_mode} instead of WAL",
+            RuntimeWarning
+        )
+
+    connection.executescript(CONNECTION_PRAGMAS)
     return connection
 
 
+def _get_pool() -> queue.Queue:
+    """
+    Return the connection pool, creating it on first use.
+
+    The pool is created lazily (not at import time) so that importing this
+    module never opens the database file, and so that worker processes
+    forked by a server each open their own connections.
+
+    Returns:
+        queue.Queue: Queue holding the idle connections
+    """
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            # Check again: another thread may have created it while we waited
+            if _pool is None:
+                pool = queue.Queue(maxsize=POOL_SIZE)
+                for _ in range(POOL_SIZE):
+                    pool.put(_create_connection())
+                _pool = pool
+
+    return _pool
+
+
+@contextmanager
+def borrow_connection():
+    """
+    Borrow a connection from the pool for the duration of a `with` block.
+
+    Connections are reused between calls instead of being opened and closed
+    for every query. If all connections are busy, the caller waits until
+    one is returned.
+
+    Usage:
+        with borrow_connection() as connection:
+            connection.execute('SELECT ...')
+
+    Yields:
+        sqlite3.Connection: Database connection object
+    """
+    pool = _get_pool()
+    connection = pool.get()
+
+    try:
+        yield connection
+    finally:
+        # Always give the connection back, even if the query failed
+        pool.put(connection)
+
+
+def close_pool(close_connections: bool = True) -> None:
+    """
+    Close every pooled connection and forget the pool.
+
+    Registered with atexit so connections are closed cleanly when the
+    process exits (SQLite then also checkpoints the WAL file).
+
+    Connections that are borrowed at the moment of the call are not
+    closed; they are dropped together with the old pool.
+
+    Args:
+        close_connections: Set to False in a freshly forked worker process.
+            Connections inherited from the parent process must not be used
+            or closed there (SQLite's file locks belong to the parent), so
+            they are only forgotten. The next query opens a new pool.
+    """
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+
+    if pool is None:
+        return
+
+    if not close_connections:
+        # Keep a reference: a garbage-collected connection would be
+        # closed automatically, which is exactly what must not happen
+        _abandoned_pools.append(pool)
+        return
+
+    while True:
+        try:
+            connection = pool.get_nowait()
+        except queue.Empty:
+            break
+        connection.close()
+
+
+atexit.register(close_pool)
+
+
+# SQL used by the helper functions below
+# Every statement is a module-level constant: the exact same string is
+# passed to SQLite on every call, so the connection's statement cache
+# (STATEMENT_CACHE_SIZE) always finds the compiled version.
+# (Queries with one "?" per ID, like get_users_by_ids, depend on the
+# number of IDs and are still built per call.)
+USER_BY_ID_QUERY = 'SELECT id, name, email FROM users WHERE id = ?'
+ALL_USERS_QUERY = 'SELECT id, name, email FROM users ORDER BY id'
+
+
 def get_user_by_id(user_id: int) -> Optional[User]:
     """
     Retrieve a user by their ID.
 
+    Users rarely change but are looked up very often (e.g. as the author
+    of posts), so found users are cached for a short time
+    (see cache.USERS_CACHE_TTL). Returned User objects are shared and
+    must not be modified.
+
     Args:
         user_id: The ID of the user to retrieve
 
     Returns:
         User object if found, None otherwise
     """
-    connection = get_db_connection()
-    cursor = connection.cursor()
+    cache_key = users_cache.make_key('user', user_id)
+    cached_user = users_cache.get(cache_key)
+    if cached_user is not None:
+        return cached_user
 
-    cursor.execute(
-        'SELECT id, name, email FROM users WHERE id = ?',
-        (user_id,)
-    )
+    with borrow_connection() as connection:
+        cursor = connection.cursor()
 
-    row = cursor.fetchone()
-    connection.close()
+        cursor.execute(USER_BY_ID_QUERY, (user_id,))
+
+        row = cursor.fetchone()
 
     if row:
-        return User(
+        user = User(
             id=row['id'],
             name=row['name'],
             email=row['email']
         )
+        users_cache.set(cache_key, user)
+        return user
 
+    # Unknown IDs are not cached, so a newly created user shows up at once
     return None
 
 
@@ -71,81 +250,176 @@ def get_all_users() -> List[User]:
     """
     Retrieve all users from the database.
 
+    Results are cached for a short time (see cache.USERS_CACHE_TTL).
+
     Returns:
         List of User objects
     """
-    connection = get_db_connection()
-    cursor = connection.cursor()
+    cache_key = users_cache.make_key('all_users')
+    cached_users = users_cache.get(cache_key)
+    if cached_users is not None:
+        return cached_users
 
-    cursor.execute('SELECT id, name, email FROM users ORDER BY id')
+    with borrow_connection() as connection:
+        cursor = connection.cursor()
 
-    rows = cursor.fetchall()
-    connection.close()
+        cursor.execute(ALL_USERS_QUERY)
 
-    users = [
-        User(id=row['id'], name=row['name'], email=row['email'])
-        for row in rows
-    ]
+        rows = cursor.fetchall()
 
+    # Columns by position: 0 = id, 1 = name, 2 = email
+    _User = User
+    users = [_User(id=row[0], name=row[1], email=row[2]) for row in rows]
+
+    users_cache.set(cache_key, users)
     return users
 
 
-def get_posts(
-    page: int = 1,
-    limit: int = 10,
-    sort_by: str = 'created_at',
-    order: str = 'desc',
-    search: Optional[str] = None
-) -> PaginatedResponse:
+def get_users_by_ids(user_ids: List[int]) -> Dict[int, User]:
     """
-    Retrieve posts with pagination, sorting, and search capabilities.
+    Retrieve several users in a single query.
 
-    This is the main function for fetching posts. It supports:
-    - Pagination: Split results into pages
-    - Sorting: Order by any column (usually created_at)
-    - Search: Filter by keyword in title or content
+    This is used to batch author lookups (e.g. by the GraphQL DataLoader)
+    so that N posts need one query instead of N queries.
 
     Args:
-        page: Page number (1-indexed)
-        limit: Number of posts per page
-        sort_by: Column to sort by ('created_at' or 'title')
-        order: Sort order ('asc' or 'desc')
-        search: Optional search keyword
+        user_ids: IDs of the users to retrieve
 
     Returns:
-        PaginatedResponse containing posts and pagination metadata
+        Dictionary mapping user ID to User object (missing IDs are left out)
     """
-    connection = get_db_connection()
-    cursor = connection.cursor()
+    if not user_ids:
+        return {}
 
-    # Build the WHERE clause for search
-    where_clause = ""
-    params = []
+    # Users found in the cache (see get_user_by_id) need no query
+    users = {}
+    missing_ids = []
+    for user_id in user_ids:
+        cached_user = users_cache.get(users_cache.make_key('user', user_id))
+        if cached_user is not None:
+            users[user_id] = cached_user
+        else:
+            missing_ids.append(user_id)
 
-    if search:
-        where_clause = "WHERE posts.title LIKE ? OR posts.content LIKE ?"
-        search_pattern = f'%{search}%'
-        params = [search_pattern, search_pattern]
+    if not missing_ids:
+        return users
 
-    # Validate sort column to prevent SQL injection
-    allowed_sort_columns = ['created_at', 'title', 'id']
-    if sort_by not in allowed_sort_columns:
-        sort_by = 'created_at'
+    # One "?" placeholder per ID: WHERE id IN (?, ?, ?)
+    placeholders = ', '.join('?' for _ in missing_ids)
+    query = f'SELECT id, name, email FROM users WHERE id IN ({placeholders})'
 
-    # Validate sort order
-    order = 'DESC' if order.lower() == 'desc' else 'ASC'
+    with borrow_connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute(query, missing_ids)
+        rows = cursor.fetchall()
 
-    # Count total posts (for pagination metadata)
-    count_query = f'SELECT COUNT(*) FROM posts {where_clause}'
-    cursor.execute(count_query, params)
-    total = cursor.fetchone()[0]
+    # Columns by position: 0 = id, 1 = name, 2 = email
+    _User = User
+    for row in rows:
+        user = _User(id=row[0], name=row[1], email=row[2])
+        users[row[0]] = user
+        users_cache.set(users_cache.make_key('user', row[0]), user)
 
-    # Calculate pagination values
-    total_pages = math.ceil(total / limit) if total > 0 else 0
-    offset = (page - 1) * limit
+    return users
 
-    # Build the main query with JOIN to include author information
-    query = f'''
+
+# Columns that posts may be sorted by (anything else is rejected,
+# which also keeps user input out of the ORDER BY clause)
+ALLOWED_SORT_COLUMNS = ('created_at', 'title', 'id')
+
+# Same columns as a frozenset: checking `x in SORT_FIELDS` is a single
+# hash lookup (and the set is built once, not on every call)
+SORT_FIELDS = frozenset(ALLOWED_SORT_COLUMNS)
+
+# Accepted sort orders mapped to their SQL keyword
+# The common spellings are listed so most requests skip order.lower()
+ORDER_KEYWORDS = {
+    'asc': 'ASC',
+    'desc': 'DESC',
+    'ASC': 'ASC',
+    'DESC': 'DESC'
+}
+
+# WHERE condition used when a search keyword is given
+# Uses the full-text index (posts_fts, created by init_db.py) instead of
+# `LIKE '%keyword%'`, which would have to read the content of every post
+POSTS_SEARCH_CONDITION = (
+    'posts.id IN (SELECT rowid FROM posts_fts WHERE posts_fts MATCH ?)'
+)
+
+
+# Characters FTS5 cannot take inside a quoted phrase:
+# - NUL ends the query text early ("unterminated string" error)
+# - lone surrogates (\ud800-\udfff) cannot be encoded as UTF-8 at all
+_FTS_UNSAFE_CHARACTERS = re.compile('[\x00\ud800-\udfff]')
+
+# FTS5 query that matches no post (an empty phrase)
+FTS_MATCH_NOTHING = '""'
+
+
+def _to_fts_query(search: str) -> str:
+    """
+    Turn a user's search keyword into a safe FTS5 MATCH expression.
+
+    The keyword is wrapped in double quotes, so FTS5 treats it as a plain
+    phrase: operators like AND, OR, NOT, * or column filters typed by the
+    user have no special meaning. The trailing * makes the last word a
+    prefix, so the start of a word is enough: "graph" finds "GraphQL" and
+    "organiz" finds "organizing". Unlike the old LIKE search, a piece from
+    the middle of a word (e.g. "raphQ") does not match.
+
+    Characters FTS5 cannot handle (see _FTS_UNSAFE_CHARACTERS) are
+    removed first. If nothing but spaces is left, the query matches no
+    posts, just like the LIKE search found nothing for such input.
+
+    Args:
+        search: Search keyword as typed by the user
+
+    Returns:
+        str: FTS5 query, e.g. '"rest api"*'
+    """
+    cleaned = _FTS_UNSAFE_CHARACTERS.sub('', search)
+    if not cleaned.strip():
+        return FTS_MATCH_NOTHING
+
+    # Inside quotes, a double quote is written twice
+    escaped = cleaned.replace('"', '""')
+    return f'"{escaped}"*'
+
+
+def _build_posts_query(has_search: bool, has_cursor: bool, sort_by: str, order: str) -> str:
+    """
+    Build the SQL for one variant of the post listing query.
+
+    Called only at import time to fill POSTS_QUERIES.
+
+    Args:
+        has_search: Whether the search condition is included
+        has_cursor: Whether the keyset (cursor) condition is included
+        sort_by: Column to sort by (one of ALLOWED_SORT_COLUMNS)
+        order: 'ASC' or 'DESC'
+
+    Returns:
+        str: SQL text with ? placeholders
+    """
+    conditions = []
+
+    if has_search:
+        conditions.append(POSTS_SEARCH_CONDITION)
+
+    if has_cursor:
+        # Row-value comparison: posts after the cursor, the ID breaks ties
+        comparison = '<' if order == 'DESC' else '>'
+        conditions.append(f'(posts.{sort_by}, posts.id) {comparison} (?, ?)')
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    # Main query with JOIN to include author information
+    # LIMIT is given one more than the page size: if that extra row comes
+    # back, another page follows (the total comes from POSTS_COUNT_QUERIES).
+    # Without a window count, SQLite can read the posts in index order and
+    # stop after LIMIT rows instead of collecting and sorting every match.
+    return f'''
         SELECT
             posts.id,
             posts.title,
@@ -158,46 +432,603 @@ def get_posts(
         FROM posts
         JOIN users ON posts.author_id = users.id
         {where_clause}
-        ORDER BY posts.{sort_by} {order}
+        ORDER BY posts.{sort_by} {order}, posts.id {order}
         LIMIT ? OFFSET ?
     '''
 
-    # Add limit and offset to params
-    params.extend([limit, offset])
 
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    connection.close()
+# Every possible post listing query, built once when the module loads.
+# Key: (has_search, has_cursor, sort_by, order)
+# Reusing the exact same SQL strings means SQLite's statement cache can
+# hand back the already compiled statement instead of parsing it again,
+# and no SQL has to be assembled per request.
+POSTS_QUERIES = {
+    (has_search, has_cursor, sort_by, order):
+        _build_posts_query(has_search, has_cursor, sort_by, order)
+    for has_search in (False, True)
+    for has_cursor in (False, True)
+    for sort_by in ALLOWED_SORT_COLUMNS
+    for order in ('ASC', 'DESC')
+}
 
-    # Convert database rows to Post objects with author information
-    posts = []
-    for row in rows:
-        author = User(
-            id=row['user_id'],
-            name=row['user_name'],
-            email=row['user_email']
-        )
+# Total number of posts, without / with the search condition
+# - Without a search, the total is read from the `counters` table, which
+#   triggers keep up to date (see init_db.py): one row, no table scan
+# - With a search, only the full-text index is counted: the triggers keep
+#   exactly one index entry per post, so the posts table is not touched
+POSTS_COUNT_QUERIES = {
+    False: "SELECT value FROM counters WHERE name = 'posts'",
+    True: 'SELECT COUNT(*) FROM posts_fts WHERE posts_fts MATCH ?'
+}
 
-        post = Post(
-            id=row['id'],
-            title=row['title'],
-            content=row['content'],
-            author_id=row['author_id'],
-            created_at=row['created_at'],
-            author=author
-        )
 
-        posts.append(post)
+def _encode_cursor(sort_value, post_id: int) -> str:
+    """
+    Build an opaque pagination cursor from the last post of a page.
+
+    The cursor stores the value of the sort column and the post ID
+    (the ID breaks ties between posts with the same sort value).
+
+    Args:
+        sort_value: Value of the sort column for the last post
+        post_id: ID of the last post
+
+    Returns:
+        URL-safe base64 string, e.g. for "1759314600|7"
+    """
+    raw = f'{sort_value}|{post_id}'
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort_by: str) -> Tuple:
+    """
+    Read the sort value and post ID back out of a pagination cursor.
+
+    Args:
+        cursor: Cursor created by _encode_cursor
+        sort_by: Column the posts are sorted by
+
+    Returns:
+        Tuple of (sort_value, post_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        # rsplit: titles may contain "|", the ID after the last one never does
+        sort_value, post_id = raw.rsplit('|', 1)
+        post_id = int(post_id)
+        # created_at and id are stored as integers, only titles are text
+        if sort_by != 'title':
+            sort_value = int(sort_value)
+    except (ValueError, UnicodeError) as error:
+        raise ValueError('Invalid cursor') from error
+
+    return sort_value, post_id
+
+
+def _normalize_sorting(sort_by: str, order: str) -> Tuple[str, str]:
+    """
+    Make sure the sort column and order are safe to put into SQL.
+
+    Unknown columns fall back to 'created_at' (this also prevents SQL
+    injection through the ORDER BY clause), unknown orders to 'ASC'.
+
+    Args:
+        sort_by: Requested sort column
+        order: Requested sort order ('asc' or 'desc', any case)
+
+    Returns:
+        Tuple of (sort column, 'ASC' or 'DESC')
+    """
+    if sort_by not in SORT_FIELDS:
+        sort_by = 'created_at'
+
+    keyword = ORDER_KEYWORDS.get(order)
+    if keyword is None:
+        # Unusual spelling such as 'Desc'
+        keyword = 'DESC' if order.lower() == 'desc' else 'ASC'
+
+    return sort_by, keyword
+
+
+def _posts_query_parts(
+    page: int,
+    limit: int,
+    sort_by: str,
+    order: str,
+    search: Optional[str],
+    after: Optional[str]
+) -> Tuple[str, list, str, list]:
+    """
+    Pick the SQL and parameters for one post listing request.
+
+    Shared by get_posts and iter_posts. `sort_by` and `order` must
+    already be validated ('created_at'/'title'/'id' and 'ASC'/'DESC').
+
+    Returns:
+        Tuple of (query, params, count_query, search_params)
+
+    Raises:
+        ValueError: If `after` is not a valid cursor
+    """
+    # Parameters for the search condition
+    search_params = []
+    if search:
+        search_params = [_to_fts_query(search)]
+
+    params = list(search_params)
+
+    if after:
+        # Keyset pagination: only posts that come after the cursor
+        sort_value, post_id = _decode_cursor(after, sort_by)
+        params.extend([sort_value, post_id])
+        offset = 0
+    else:
+        offset = (page - 1) * limit
+
+    # One extra row tells us whether another page follows
+    params.extend([limit + 1, offset])
+
+    # Pick the prebuilt SQL for this combination (see POSTS_QUERIES)
+    query = POSTS_QUERIES[(bool(search), bool(after), sort_by, order)]
+
+    # Counts every post matching the search
+    count_query = POSTS_COUNT_QUERIES[bool(search)]
+
+    return query, params, count_query, search_params
+
+
+def _count_total(cursor: sqlite3.Cursor, count_query: str, search_params: list) -> int:
+    """
+    Read the total number of matching posts for the pagination info.
+
+    Args:
+        cursor: Cursor of the connection that ran the page query
+        count_query: Query from POSTS_COUNT_QUERIES
+        search_params: Parameters for the search condition
+
+    Returns:
+        int: Total number of posts matching the search
+    """
+    cursor.execute(count_query, search_params)
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+
+def _next_cursor(last_row: Optional[sqlite3.Row], has_more: bool, sort_by: str) -> Optional[str]:
+    """
+    Build the cursor for the page after this one.
+
+    Args:
+        last_row: Last row of the page (None if the page is empty)
+        has_more: Whether more posts follow this page
+        sort_by: Column the posts are sorted by
+
+    Returns:
+        The cursor, or None if no more posts follow
+    """
+    if last_row is None or not has_more:
+        return None
+
+    return _encode_cursor(last_row[sort_by], last_row['id'])
+
+
+# Post listings without a search or cursor are served from an in-memory
+# snapshot of every post while the table has at most this many posts.
+# Above that, keeping all posts in memory would cost more than it saves
+# and the listing always runs the SQL query.
+SNAPSHOT_MAX_POSTS = 5000
+
+# Position of each sort column in a listing row (see _build_posts_query)
+SORT_COLUMN_POSITIONS = {'id': 0, 'title': 1, 'created_at': 4}
+
+# Held while one thread rebuilds the snapshot (see _load_posts_snapshot)
+_snapshot_lock = threading.Lock()
+
+
+def _load_posts_snapshot() -> Optional[Dict[Tuple[str, str], List[sqlite3.Row]]]:
+    """
+    Read every post once and keep it sorted in every supported order.
+
+    The snapshot maps (sort_by, order) to all listing rows in that order,
+    e.g. ('created_at', 'DESC'). A page is then just a slice of one list:
+    no SQL runs and nothing is sorted per request. The sorting happens
+    once per snapshot, ties are broken by ID like ORDER BY ..., id does.
+
+    The snapshot is kept in posts_cache, so it expires after
+    POSTS_CACHE_TTL seconds and posts_cache.invalidate() drops it, exactly
+    like the cached pages.
+
+    Only one thread rebuilds an expired snapshot. Requests arriving in the
+    meantime get None and run their (single page) SQL query, instead of
+    all reading and sorting every post at the same time.
+
+    Returns:
+        The snapshot, or None if there are more than SNAPSHOT_MAX_POSTS posts
+        or another thread is building it right now
+    """
+    cache_key = posts_cache.make_key('snapshot')
+    snapshot = posts_cache.get(cache_key)
+    if snapshot is not None:
+        # An empty dict is cached when the table is too large
+        return snapshot or None
+
+    if not _snapshot_lock.acquire(blocking=False):
+        return None
 
+    try:
+        return _build_posts_snapshot(cache_key)
+    finally:
+        _snapshot_lock.release()
+
+
+def _build_posts_snapshot(cache_key: Tuple) -> Optional[Dict[Tuple[str, str], List[sqlite3.Row]]]:
+    """
+    Read and sort the posts for _load_posts_snapshot (caller holds the lock).
+
+    Args:
+        cache_key: posts_cache key the snapshot is stored under
+
+    Returns:
+        The snapshot, or None if there are more than SNAPSHOT_MAX_POSTS posts
+    """
+    # Another thread may have finished a rebuild just before we got the lock
+    snapshot = posts_cache.get(cache_key)
+    if snapshot is not None:
+        return snapshot or None
+
+    with borrow_connection() as connection:
+        cursor = connection.cursor()
+
+        if _count_total(cursor, POSTS_COUNT_QUERIES[False], []) > SNAPSHOT_MAX_POSTS:
+            # Remember the answer, so the count is not read on every request
+            posts_cache.set(cache_key, {})
+            return None
+
+        # The plain listing query ordered by ID, LIMIT -1 = no limit
+        cursor.execute(POSTS_QUERIES[(False, False, 'id', 'ASC')], [-1, 0])
+        rows = cursor.fetchall()
+
+    snapshot = {}
+    for sort_by, position in SORT_COLUMN_POSITIONS.items():
+        ascending = sorted(rows, key=lambda row: (row[position], row[0]))
+        snapshot[(sort_by, 'ASC')] = ascending
+        # IDs are unique, so the reversed list is exactly the DESC order
+        snapshot[(sort_by, 'DESC')] = ascending[::-1]
+
+    posts_cache.set(cache_key, snapshot)
+    return snapshot
+
+
+def get_posts(
+    page: int = 1,
+    limit: int = 10,
+    sort_by: str = 'created_at',
+    order: str = 'desc',
+    search: Optional[str] = None,
+    after: Optional[str] = None
+) -> PaginatedResponse:
+    """
+    Retrieve posts with pagination, sorting, and search capabilities.
+
+    This is the main function for fetching posts. It supports:
+    - Pagination: Split results into pages
+    - Sorting: Order by any column (usually created_at)
+    - Search: Filter by keyword in title or content (full-text index)
+
+    Results are cached for a short time (see cache.POSTS_CACHE_TTL), so
+    repeated requests for the same page do not hit the database. Listings
+    without a search or cursor are cut from an in-memory snapshot of all
+    posts (see _load_posts_snapshot) instead of running the query.
+
+    Two pagination styles are available:
+    - page: Classic page numbers (uses OFFSET, slower for deep pages)
+    - after: Cursor from the previous page's next_cursor. SQLite seeks
+      directly to the next post using the index instead of skipping rows,
+      so every page costs the same no matter how deep it is
+
+    Args:
+        page: Page number (1-indexed, ignored when `after` is given)
+        limit: Number of posts per page
+        sort_by: Column to sort by ('created_at' or 'title')
+        order: Sort order ('asc' or 'desc')
+        search: Optional search keyword
+        after: Optional cursor to continue from (keyset pagination)
+
+    Returns:
+        PaginatedResponse containing post rows and pagination metadata.
+        Each item in `data` is a sqlite3.Row with the post columns plus
+        user_id, user_name and user_email (use posts_to_dicts for JSON)
+
+    Raises:
+        ValueError: If `after` is not a valid cursor
+    """
+    sort_by, order = _normalize_sorting(sort_by, order)
+
+    # Plain page-number listings are sliced out of the in-memory snapshot.
+    # The slice is cheap, so these pages are not cached separately.
+    if not search and not after:
+        snapshot = _load_posts_snapshot()
+
+        if snapshot is not None:
+            sorted_rows = snapshot[(sort_by, order)]
+            offset = (page - 1) * limit
+
+            # One extra row, like the LIMIT in the SQL query
+            rows = sorted_rows[offset:offset + limit + 1]
+            return _paginate(rows, page, limit, len(sorted_rows), sort_by)
+
+    # Serve repeated requests for the same page from the cache
+    cache_key = posts_cache.make_key(page, limit, sort_by, order, search, after)
+    cached_response = posts_cache.get(cache_key)
+    if cached_response is not None:
+        return cached_response
+
+    query, params, count_query, search_params = _posts_query_parts(
+        page, limit, sort_by, order, search, after
+    )
+
+    with borrow_connection() as connection:
+        cursor = connection.cursor()
+
+        try:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+
+            total = _count_total(cursor, count_query, search_params)
+        except sqlite3.OperationalError:
+            # A search FTS5 still cannot run (see _to_fts_query):
+            # answer with an empty page instead of a server error
+            if not search:
+                raise
+            rows, total = [], 0
+
+    paginated_response = _paginate(rows, page, limit, total, sort_by)
+    posts_cache.set(cache_key, paginated_response)
+    return paginated_response
+
+
+def _paginate(
+    rows: List[sqlite3.Row],
+    page: int,
+    limit: int,
+    total: int,
+    sort_by: str
+) -> PaginatedResponse:
+    """
+    Wrap the rows of one page with their pagination metadata.
+
+    Args:
+        rows: Up to `limit + 1` rows (the extra row means more posts follow)
+        page: Requested page number
+        limit: Number of posts per page
+        total: Total number of matching posts
+        sort_by: Column the posts are sorted by (for the next cursor)
+
+    Returns:
+        PaginatedResponse with at most `limit` rows
+    """
+    # The query asked for one row more than the page size:
+    # if it came back, another page follows (the extra row is dropped)
+    has_more = len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+
+    # Calculate pagination values
+    total_pages = math.ceil(total / limit) if total > 0 else 0
+
+    # Cursor pointing at the last post of this page, if more posts follow
+    next_cursor = _next_cursor(rows[-1] if rows else None, has_more, sort_by)
+
+    # The rows are returned as-is (see posts_to_dicts): building User and
+    # Post objects for every row would only be thrown away again by the API
     return PaginatedResponse(
-        data=posts,
+        data=rows,
         page=page,
         limit=limit,
         total=total,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
 
 
+def format_timestamp(epoch_seconds: int) -> str:
+    """
+    Turn a stored created_at value into the ISO string the APIs return.
+
+    created_at is stored as a unix timestamp (seconds since 1970 in UTC,
+    see init_db.py). It is converted only when a post leaves the database
+    helpers, so SQLite itself sorts and compares plain integers.
+
+    Args:
+        epoch_seconds: Value of the posts.created_at column
+
+    Returns:
+        str: UTC time in ISO 8601 format, e.g. "2025-10-03T10:30:00Z"
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch_seconds))
+
+
+def posts_to_dicts(rows: List[sqlite3.Row]) -> List[dict]:
+    """
+    Convert post rows from get_posts into JSON-ready dictionaries.
+
+    Produces the same structure as Post.to_dict() with the author included,
+    but without creating intermediate User/Post objects for every row.
+    This is the fast path of GET /posts: rows go straight from SQLite
+    to dictionaries and then to orjson.
+
+    Args:
+        rows: Rows returned in get_posts(...).data
+
+    Returns:
+        List of post dictionaries
+    """
+    # Columns by position (see _build_posts_query): 0 = id, 1 = title,
+    # 2 = content, 3 = author_id, 4 = created_at, 5 = user_id,
+    # 6 = user_name, 7 = user_email
+    # row[0] is a direct index into the row, row['id'] has to look the
+    # column name up first
+    return [
+        {
+            'id': row[0],
+            'title': row[1],
+            'content': row[2],
+            'author_id': row[3],
+            'created_at': format_timestamp(row[4]),
+            'author': {
+                'id': row[5],
+                'name': row[6],
+                'email': row[7]
+            }
+        }
+        for row in rows
+    ]
+
+
+# Rows fetched from SQLite at a time while streaming a listing
+STREAM_BATCH_SIZE = 20
+
+
+class PostStream:
+    """
+    Post listing that is read from the database while it is consumed.
+
+    Created by iter_posts. Looping over it yields one post dictionary
+    (same format as posts_to_dicts) at a time. Once the loop has finished,
+    `pagination` holds the pagination metadata (same format as
+    PaginatedResponse.pagination_to_dict).
+
+    A pooled connection is borrowed briefly when the stream is created (to
+    count the matching posts), and again only while the loop runs. It is
+    given back when the loop ends or is stopped early (e.g. the client
+    disconnected).
+
+    Usage:
+        stream = iter_posts(limit=100)
+        for post in stream:
+            send(post)
+        send(stream.pagination)
+    """
+
+    def __init__(self, page, limit, sort_by, order, search, after):
+        self.page = page
+        self.limit = limit
+        self.sort_by = sort_by
+        self.after = after
+        self.pagination: Optional[dict] = None
+
+        # Done here (not while looping) so an invalid cursor raises
+        # ValueError before anything has been sent to the client
+        (self._query, self._params, count_query,
+         search_params) = _posts_query_parts(
+            page, limit, sort_by, order, search, after
+        )
+
+        # The total is counted up front for the same reason: a search FTS5
+        # cannot run (see _to_fts_query) fails here, while an error status
+        # can still be sent, instead of cutting off a half-sent response.
+        # The count runs the same MATCH as the listing query.
+        self._has_results = True
+        with borrow_connection() as connection:
+            try:
+                self._total = _count_total(connection.cursor(), count_query, search_params)
+            except sqlite3.OperationalError:
+                if not search:
+                    raise
+                # Same answer as get_posts: an empty page
+                self._total = 0
+                self._has_results = False
+
+    def __iter__(self) -> Iterator[dict]:
+        row_count = 0
+        last_row = None
+        has_more = False
+
+        if self._has_results:
+            with borrow_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._query, self._params)
+
+                # Fetch a few rows at a time instead of all of them at once
+                rows = cursor.fetchmany(STREAM_BATCH_SIZE)
+                while rows:
+                    needed = self.limit - row_count
+                    if len(rows) > needed:
+                        # The extra row (see _posts_query_parts) only tells us
+                        # that another page follows, it is not sent
+                        rows = rows[:needed]
+                        has_more = True
+
+                    if rows:
+                        row_count += len(rows)
+                        last_row = rows[-1]
+                        yield from posts_to_dicts(rows)
+
+                    if has_more:
+                        break
+
+                    rows = cursor.fetchmany(STREAM_BATCH_SIZE)
+
+        total = self._total
+        self.pagination = {
+            'page': self.page,
+            'limit': self.limit,
+            'total': total,
+            'total_pages': math.ceil(total / self.limit) if total > 0 else 0,
+            'next_cursor': _next_cursor(last_row, has_more, self.sort_by)
+        }
+
+def iter_posts(
+    page: int = 1,
+    limit: int = 10,
+    sort_by: str = 'created_at',
+    order: str = 'desc',
+    search: Optional[str] = None,
+    after: Optional[str] = None
+) -> PostStream:
+    """
+    Like get_posts, but hands out the posts one by one as they are read.
+
+    Used to stream large pages: the response can start before every row
+    is fetched, and the whole page never sits in memory at once.
+    Streamed listings are not cached.
+
+    Args:
+        Same as get_posts
+
+    Returns:
+        PostStream: Loop over it for the post dicts, then read .pagination
+
+    Raises:
+        ValueError: If `after` is not a valid cursor
+    """
+    sort_by, order = _normalize_sorting(sort_by, order)
+
+    return PostStream(page, limit, sort_by, order, search, after)
+
+
+# A user's newest posts with the author (used by get_user_posts)
+USER_POSTS_QUERY = '''
+    SELECT
+        posts.id,
+        posts.title,
+        posts.content,
+        posts.author_id,
+        posts.created_at,
+        users.id as user_id,
+        users.name as user_name,
+        users.email as user_email
+    FROM posts
+    JOIN users ON posts.author_id = users.id
+    WHERE posts.author_id = ?
+    ORDER BY posts.created_at DESC
+    LIMIT ?
+'''
+
+
 def get_user_posts(user_id: int, limit: int = 3) -> List[Post]:
     """
     Retrieve posts by a specific user.
@@ -212,51 +1043,173 @@ def get_user_posts(user_id: int, limit: int = 3) -> List[Post]:
     Returns:
         List of Post objects
     """
-    connection = get_db_connection()
-    cursor = connection.cursor()
+    with borrow_connection() as connection:
+        cursor = connection.cursor()
 
-    query = '''
-        SELECT
-            posts.id,
-            posts.title,
-            posts.content,
-            posts.author_id,
-            posts.created_at,
-            users.id as user_id,
-            users.name as user_name,
-            users.email as user_email
-        FROM posts
-        JOIN users ON posts.author_id = users.id
-        WHERE posts.author_id = ?
-        ORDER BY posts.created_at DESC
-        LIMIT ?
+        cursor.execute(USER_POSTS_QUERY, (user_id, limit))
+
+        # fetchmany(limit) asks the C layer for exactly the rows we need
+        rows = cursor.fetchmany(limit)
+
+    # Convert rows to Post objects in one list comprehension.
+    # - Columns are read by position (row[0]) instead of by name
+    #   (row['id']), which skips a name lookup for every value
+    # - User and Post are bound to local names, which Python finds
+    #   faster than global names inside the loop
+    _User, _Post = User, Post
+    return [
+        _Post(
+            id=row[0],
+            title=row[1],
+            content=row[2],
+            author_id=row[3],
+            created_at=format_timestamp(row[4]),
+            author=_User(id=row[5], name=row[6], email=row[7])
+        )
+        for row in rows
+    ]
+
+
+# A user plus their newest posts (used by get_user_with_posts)
+USER_WITH_POSTS_QUERY = '''
+    SELECT
+        users.id,
+        users.name,
+        users.email,
+        posts.id,
+        posts.title,
+        posts.content,
+        posts.created_at
+    FROM users
+    LEFT JOIN posts ON posts.author_id = users.id
+    WHERE users.id = ?
+    ORDER BY posts.created_at DESC
+    LIMIT ?
+'''
+
+
+def get_user_with_posts(user_id: int, limit: int = 3) -> Optional[Tuple[User, List[Post]]]:
+    """
+    Retrieve a user together with their most recent posts in one query.
+
+    LEFT JOIN keeps the user row even if they have no posts (the post
+    columns are then NULL), so one query tells us both whether the user
+    exists and what their posts are.
+
+    Args:
+        user_id: ID of the user
+        limit: Maximum number of posts to return (default: 3)
+
+    Returns:
+        Tuple of (User, list of Post objects newest first), or None if
+        the user does not exist
+    """
+    with borrow_connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute(USER_WITH_POSTS_QUERY, (user_id, limit))
+        rows = cursor.fetchmany(limit)
+
+    if not rows:
+        return None
+
+    # Columns by position: 0-2 = user, 3-6 = post
+    first_row = rows[0]
+    user = User(id=first_row[0], name=first_row[1], email=first_row[2])
+
+    # A user without posts comes back as a single row with NULL post columns
+    _Post = Post
+    posts = [
+        _Post(
+            id=row[3],
+            title=row[4],
+            content=row[5],
+            author_id=user.id,
+            created_at=format_timestamp(row[6]),
+            author=user
+        )
+        for row in rows
+        if row[3] is not None
+    ]
+
+    return user, posts
+
+
+def get_recent_posts_for_users(user_ids: List[int], limit: int = 3) -> Dict[int, List[Post]]:
+    """
+    Retrieve the most recent posts of several users in a single query.
+
+    Same result as calling get_user_posts once per user, but with one
+    database round trip: ROW_NUMBER() numbers each user's posts from
+    newest to oldest, and only the first `limit` of every user are kept.
+    Used by the GraphQL DataLoader for queries like `users { posts }`.
+
+    Args:
+        user_ids: IDs of the users whose posts to retrieve
+        limit: Maximum number of posts per user (default: 3)
+
+    Returns:
+        Dictionary mapping user ID to that user's posts (newest first).
+        Users without posts map to an empty list. The posts have no
+        `author` set, the caller already knows the users.
+    """
+    if not user_ids:
+        return {}
+
+    # One "?" placeholder per ID: WHERE author_id IN (?, ?, ?)
+    placeholders = ', '.join('?' for _ in user_ids)
+    query = f'''
+        SELECT id, title, content, author_id, created_at
+        FROM (
+            SELECT
+                posts.id,
+                posts.title,
+                posts.content,
+                posts.author_id,
+                posts.created_at,
+                ROW_NUMBER() OVER (
+                    PARTITION BY posts.author_id
+                    ORDER BY posts.created_at DESC
+                ) as row_number
+            FROM posts
+            WHERE posts.author_id IN ({placeholders})
+        )
+        WHERE row_number <= ?
+        ORDER BY author_id, row_number
     '''
 
-    cursor.execute(query, (user_id, limit))
-    rows = cursor.fetchall()
-    connection.close()
+    with borrow_connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute(query, list(user_ids) + [limit])
+        rows = cursor.fetchall()
+
+    posts_by_user: Dict[int, List[Post]] = {user_id: [] for user_id in user_ids}
 
-    # Convert rows to Post objects
-    posts = []
+    # Columns by position: 0 = id, 1 = title, 2 = content,
+    # 3 = author_id, 4 = created_at
+    _Post = Post
     for row in rows:
-        author = User(
-            id=row['user_id'],
-            name=row['user_name'],
-            email=row['user_email']
+        posts_by_user[row[3]].append(
+            _Post(id=row[0], title=row[1], content=row[2], author_id=row[3], created_at=format_timestamp(row[4]))
         )
 
-        post = Post(
-            id=row['id'],
-            title=row['title'],
-            content=row['content'],
-            author_id=row['author_id'],
-            created_at=row['created_at'],
-            author=author
-        )
+    return posts_by_user
 
-        posts.append(post)
 
-    return posts
+# One post with its author (used by get_post_by_id)
+POST_BY_ID_QUERY = '''
+    SELECT
+        posts.id,
+        posts.title,
+        posts.content,
+        posts.author_id,
+        posts.created_at,
+        users.id as user_id,
+        users.name as user_name,
+        users.email as user_email
+    FROM posts
+    JOIN users ON posts.author_id = users.id
+    WHERE posts.id = ?
+'''
 
 
 def get_post_by_id(post_id: int) -> Optional[Post]:
@@ -269,27 +1222,11 @@ def get_post_by_id(post_id: int) -> Optional[Post]:
     Returns:
         Post object if found, None otherwise
     """
-    connection = get_db_connection()
-    cursor = connection.cursor()
-
-    query = '''
-        SELECT
-            posts.id,
-            posts.title,
-            posts.content,
-            posts.author_id,
-            posts.created_at,
-            users.id as user_id,
-            users.name as user_name,
-            users.email as user_email
-        FROM posts
-        JOIN users ON posts.author_id = users.id
-        WHERE posts.id = ?
-    '''
+    with borrow_connection() as connection:
+        cursor = connection.cursor()
 
-    cursor.execute(query, (post_id,))
-    row = cursor.fetchone()
-    connection.close()
+        cursor.execute(POST_BY_ID_QUERY, (post_id,))
+        row = cursor.fetchone()
 
     if row:
         author = User(
@@ -303,7 +1240,7 @@ def get_post_by_id(post_id: int) -> Optional[Post]:
             title=row['title'],
             content=row['content'],
             author_id=row['author_id'],
-            created_at=row['created_at'],
+            created_at=format_timestamp(row['created_at']),
             author=author
         )
 
@@ -11,19 +11,54 @@ Technology: Strawberry GraphQL
 - Uses Python type hints to define the schema
 - Clean, Pythonic syntax
 - Automatic schema generation
+
+Resolvers are async: database calls run in a worker thread through
+asyncio.to_thread, so sibling fields (e.g. the posts of every user in
+`users { posts }`) query SQLite in parallel instead of one after another.
 """
 
+import asyncio
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+import orjson
 import strawberry
-from typing import List, Optional
+from typing import Dict, List, Optional
+from flask import Response, request as flask_request
+from graphql import (
+    FieldNode,
+    GraphQLError,
+    OperationDefinitionNode,
+    get_introspection_query,
+    graphql_sync,
+    parse
+)
+from strawberry.dataloader import DataLoader
+from strawberry.extensions import ParserCache, ValidationCache
+from strawberry.flask.views import AsyncGraphQLView
 from database import (
+    ALLOWED_SORT_COLUMNS,
+    SORT_FIELDS,
     get_all_users,
     get_user_by_id,
+    get_users_by_ids,
     get_posts,
     get_user_posts,
-    get_post_by_id
+    get_recent_posts_for_users,
+    get_post_by_id,
+    format_timestamp
 )
 
 
+# Accepted values for the `order` argument of Query.posts
+# (built once here instead of a new list on every request)
+_ORDERS = frozenset(("asc", "desc"))
+
+# Error message for an unknown sortBy value (also built only once)
+_SORT_FIELDS_ERROR = f"sortBy must be one of: {', '.join(ALLOWED_SORT_COLUMNS)}"
+
+
 # GraphQL Types
 # These are the data structures that GraphQL clients can query
 
@@ -48,13 +83,17 @@ class User:
     email: str
 
     @strawberry.field
-    def posts(self, limit: int = 3) -> List['Post']:
+    async def posts(self, info: strawberry.Info, limit: int = 3) -> List['Post']:
         """
         Get posts written by this user.
 
         This is a resolver function that allows nested queries.
         Example: query { user(id: 1) { name, posts { title } } }
 
+        The posts are loaded through a DataLoader: for `users { posts }`
+        the posts of all users are fetched in one query instead of one
+        query per user.
+
         Args:
             limit: Maximum number of posts to return (default: 3)
 
@@ -65,17 +104,19 @@ class User:
         if limit < 1 or limit > 100:
             raise ValueError("Limit must be between 1 and 100")
 
-        # Reuse the database function from REST API
-        db_posts = get_user_posts(self.id, limit)
+        db_posts = await info.context["posts_loader"].load((self.id, limit))
 
         # Convert database Post objects to GraphQL Post types
+        # Every post here was written by this user, so `posts { author }`
+        # is answered with this User object, without another query
         return [
             Post(
                 id=post.id,
                 title=post.title,
                 content=post.content,
                 author_id=post.author_id,
-                created_at=post.created_at
+                created_at=post.created_at,
+                preloaded_author=self
             )
             for post in db_posts
         ]
@@ -94,39 +135,113 @@ class Post:
         title: Post title
         content: Post content/body
         author_id: ID of the user who wrote this post
-        created_at: Timestamp when post was created (ISO format string)
+        created_at: Timestamp when post was created (ISO format string, UTC)
 
     Nested queries:
         author: Get the author's information (User object)
+
+    Private (not exposed in the schema):
+        preloaded_author: Author already fetched together with the post
     """
     id: int
     title: str
     content: str
     author_id: int
     created_at: str
+    preloaded_author: strawberry.Private[Optional[User]] = None
 
     @strawberry.field
-    def author(self) -> Optional[User]:
+    async def author(self, info: strawberry.Info) -> Optional[User]:
         """
         Get the author of this post.
 
         This allows nested queries like:
         query { posts { title, author { name } } }
 
+        Most queries already JOIN the author together with the post, in
+        which case it is returned right away. Otherwise the author is
+        fetched through the per-request DataLoader, so a list of N posts
+        triggers a single batched query instead of N queries.
+
         Returns:
             User object or None if user not found
         """
-        # Fetch user information from database
-        db_user = get_user_by_id(self.author_id)
+        if self.preloaded_author is not None:
+            return self.preloaded_author
 
-        if db_user:
-            return User(
-                id=db_user.id,
-                name=db_user.name,
-                email=db_user.email
-            )
+        return await info.context["user_loader"].load(self.author_id)
 
-        return None
+
+def to_graphql_user(db_user) -> User:
+    """
+    Convert a database User object to the GraphQL User type.
+
+    Args:
+        db_user: User object returned by the database module
+
+    Returns:
+        GraphQL User object
+    """
+    return User(
+        id=db_user.id,
+        name=db_user.name,
+        email=db_user.email
+    )
+
+
+async def load_users(user_ids: List[int]) -> List[Optional[User]]:
+    """
+    Batch function for the user DataLoader.
+
+    The DataLoader collects every `load(user_id)` call made while resolving
+    one level of the query, then calls this function once with all IDs.
+
+    Args:
+        user_ids: User IDs requested during this batch
+
+    Returns:
+        List of GraphQL User objects (or None), in the same order as user_ids
+    """
+    db_users = await asyncio.to_thread(get_users_by_ids, user_ids)
+
+    return [
+        to_graphql_user(db_users[user_id]) if user_id in db_users else None
+        for user_id in user_ids
+    ]
+
+
+async def load_user_posts(keys: List[tuple]) -> List[list]:
+    """
+    Batch function for the user posts DataLoader.
+
+    Keys are (user_id, limit) pairs, because different fields of one
+    query may ask for a different number of posts. Users asking for the
+    same limit share a single query (see get_recent_posts_for_users).
+    A single key, e.g. from `user(id: 1) { posts }`, uses the simpler
+    get_user_posts query.
+
+    Args:
+        keys: (user_id, limit) pairs requested during this batch
+
+    Returns:
+        List of post lists, in the same order as keys
+    """
+    if len(keys) == 1:
+        user_id, limit = keys[0]
+        return [await asyncio.to_thread(get_user_posts, user_id, limit)]
+
+    # Group the user IDs by the requested limit
+    user_ids_by_limit: Dict[int, List[int]] = {}
+    for user_id, limit in keys:
+        user_ids_by_limit.setdefault(limit, []).append(user_id)
+
+    posts_by_key = {}
+    for limit, user_ids in user_ids_by_limit.items():
+        posts_by_user = await asyncio.to_thread(get_recent_posts_for_users, user_ids, limit)
+        for user_id, posts in posts_by_user.items():
+            posts_by_key[(user_id, limit)] = posts
+
+    return [posts_by_key[key] for key in keys]
 
 
 @strawberry.type
@@ -142,11 +257,13 @@ class PaginationInfo:
         limit: Items per page
         total: Total number of items available
         total_pages: Total number of pages
+        next_cursor: Pass as `after` to fetch the next page (null on the last page)
     """
     page: int
     limit: int
     total: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 @strawberry.type
@@ -180,13 +297,14 @@ class Query:
     """
 
     @strawberry.field
-    def posts(
+    async def posts(
         self,
         page: int = 1,
         limit: int = 10,
         sort_by: str = "created_at",
         order: str = "desc",
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        after: Optional[str] = None
     ) -> PostsResponse:
         """
         Get a paginated list of blog posts.
@@ -220,7 +338,15 @@ class Query:
              }
            }
 
-        4. With nested author:
+        4. With cursor (keyset) pagination:
+           query {
+             posts(limit: 5, after: "<nextCursor of the previous page>") {
+               data { id, title }
+               pagination { nextCursor }
+             }
+           }
+
+        5. With nested author:
            query {
              posts {
                data {
@@ -236,6 +362,7 @@ class Query:
             sort_by: Column to sort by - "created_at" or "title" (default: "created_at")
             order: Sort order - "asc" or "desc" (default: "desc")
             search: Search keyword for title/content (optional)
+            after: Cursor from pagination.nextCursor to continue from (optional)
 
         Returns:
             PostsResponse with data and pagination info
@@ -248,33 +375,42 @@ class Query:
             raise ValueError("Limit must be between 1 and 100")
 
         # Validate sort_by field
-        allowed_sort_fields = ["created_at", "title", "id"]
-        if sort_by not in allowed_sort_fields:
-            raise ValueError(f"sortBy must be one of: {', '.join(allowed_sort_fields)}")
+        if sort_by not in SORT_FIELDS:
+            raise ValueError(_SORT_FIELDS_ERROR)
 
-        # Validate order field
-        if order.lower() not in ["asc", "desc"]:
+        # Validate order field (the usual lowercase spelling skips .lower())
+        if order not in _ORDERS and order.lower() not in _ORDERS:
             raise ValueError("order must be 'asc' or 'desc'")
 
         # Reuse the database function from REST API
-        paginated_response = get_posts(
+        paginated_response = await asyncio.to_thread(
+            get_posts,
             page=page,
             limit=limit,
             sort_by=sort_by,
             order=order,
-            search=search
+            search=search,
+            after=after
         )
 
-        # Convert database Post objects to GraphQL Post types
+        # Build GraphQL Post types straight from the database rows
+        # The JOIN in get_posts already returned each author, so it is
+        # attached to the post and `posts { author }` needs no extra query
+        # (columns by position, same order as in database.posts_to_dicts)
         posts = [
             Post(
-                id=post.id,
-                title=post.title,
-                content=post.content,
-                author_id=post.author_id,
-                created_at=post.created_at
+                id=row[0],
+                title=row[1],
+                content=row[2],
+                author_id=row[3],
+                created_at=format_timestamp(row[4]),
+                preloaded_author=User(
+                    id=row[5],
+                    name=row[6],
+                    email=row[7]
+                )
             )
-            for post in paginated_response.data
+            for row in paginated_response.data
         ]
 
         # Create pagination info
@@ -282,13 +418,14 @@ class Query:
             page=paginated_response.page,
             limit=paginated_response.limit,
             total=paginated_response.total,
-            total_pages=paginated_response.total_pages
+            total_pages=paginated_response.total_pages,
+            next_cursor=paginated_response.next_cursor
         )
 
         return PostsResponse(data=posts, pagination=pagination)
 
     @strawberry.field
-    def user(self, id: int) -> Optional[User]:
+    async def user(self, id: int) -> Optional[User]:
         """
         Get a single user by ID.
 
@@ -322,7 +459,7 @@ class Query:
         Returns:
             User object or None if not found
         """
-        db_user = get_user_by_id(id)
+        db_user = await asyncio.to_thread(get_user_by_id, id)
 
         if db_user:
             return User(
@@ -334,7 +471,7 @@ class Query:
         return None
 
     @strawberry.field
-    def users(self) -> List[User]:
+    async def users(self) -> List[User]:
         """
         Get all users.
 
@@ -363,7 +500,7 @@ class Query:
         Returns:
             List of all User objects
         """
-        db_users = get_all_users()
+        db_users = await asyncio.to_thread(get_all_users)
 
         # Convert database User objects to GraphQL User types
         return [
@@ -376,6 +513,309 @@ class Query:
         ]
 
 
+# How many different query documents keep their parse/validation result
+# in memory. Clients send a handful of distinct queries over and over,
+# so a small cache is enough.
+QUERY_CACHE_SIZE = 256
+
+# Upper bound on stored persisted queries (see BlogGraphQLView)
+# When full, the query that was used longest ago is dropped
+MAX_PERSISTED_QUERIES = 1024
+
+
 # Create the GraphQL schema
-# This is the main schema object that will be used by Strawberry
-schema = strawberry.Schema(query=Query)
+# This is the main schema object that will be used by Strawberry.
+# It is built once when the module is imported and shared by every request.
+#
+# The two extensions remember the result of parsing and validating a query
+# string, so when a client repeats the same query only the execution step
+# (the resolvers) runs again.
+schema = strawberry.Schema(
+    query=Query,
+    extensions=[
+        ParserCache(maxsize=QUERY_CACHE_SIZE),
+        ValidationCache(maxsize=QUERY_CACHE_SIZE)
+    ]
+)
+
+
+# Automatic Persisted Queries (APQ): sha256 hash -> query text
+# Shared by all requests of this process. Kept in least recently used
+# order (oldest first), so queries clients still send stay stored:
+# one-off queries cannot fill the store for good.
+_persisted_queries: OrderedDict[str, str] = OrderedDict()
+_persisted_queries_lock = threading.Lock()
+
+# Ready-made responses to introspection queries: sha256(query) -> JSON bytes
+# The schema never changes while the server runs, so the answer to
+# "describe your schema" (sent by GraphiQL and most client tools on
+# startup) is always the same and only has to be computed once.
+_introspection_responses: Dict[str, bytes] = {}
+
+# Different tools send slightly different introspection queries,
+# but there are only a few of them
+MAX_INTROSPECTION_RESPONSES = 16
+
+# Every introspection query asks for __schema or __type (but not only
+# __typename, which ordinary queries often include). Queries without them
+# skip the hash and the extra parse in introspection_response entirely.
+_INTROSPECTION_FIELD = re.compile(r'__(?:schema|type)\b')
+
+
+class BlogGraphQLView(AsyncGraphQLView):
+    """
+    Flask view serving the GraphQL endpoint.
+
+    It extends Strawberry's async view to build a fresh context for every
+    request. The context holds the DataLoaders, so their cache only lives
+    for a single request and never serves stale data to another client.
+
+    It also supports Automatic Persisted Queries (the protocol used by
+    Apollo Client). Instead of sending the full query text every time,
+    a client sends only its sha256 hash:
+
+        {"extensions": {"persistedQuery": {"version": 1,
+                                           "sha256Hash": "<hash>"}}}
+
+    - Hash known: the stored query text is executed
+    - Hash unknown: the response is a GraphQL error "PersistedQueryNotFound"
+      (status 200, like Apollo Server), and the client retries once with
+      both the query and the hash
+    - Query and hash: the hash is checked and the query is stored
+    """
+
+    async def dispatch_request(self):
+        """
+        Answer introspection queries from memory, run everything else.
+
+        Returns:
+            flask.Response
+        """
+        query = None
+        if flask_request.method == "POST" and flask_request.is_json:
+            body = flask_request.get_json(silent=True)
+            # Only plain requests without variables can share one answer
+            if isinstance(body, dict) and not body.get("variables"):
+                query = body.get("query")
+        elif flask_request.method == "GET" and not flask_request.args.get("variables"):
+            query = flask_request.args.get("query")
+
+        if isinstance(query, str):
+            cached_response = introspection_response(query)
+            if cached_response is not None:
+                return Response(cached_response, mimetype="application/json")
+
+        try:
+            return await super().dispatch_request()
+        except PersistedQueryError as error:
+            # Apollo clients read these errors from a normal GraphQL
+            # response: an HTTP error status would make them think the
+            # server has no persisted query support at all
+            return Response(error.response_body(), mimetype="application/json")
+
+    async def parse_http_body(self, request):
+        """
+        Parse the request body and resolve persisted query hashes.
+
+        Returns:
+            GraphQLRequestData (or a list of them for batch requests)
+        """
+        request_data = await super().parse_http_body(request)
+
+        if isinstance(request_data, list):
+            for item in request_data:
+                resolve_persisted_query(item)
+        else:
+            resolve_persisted_query(request_data)
+
+        return request_data
+
+    async def get_context(self, request, response) -> dict:
+        """
+        Build the context passed to every resolver as `info.context`.
+
+        Returns:
+            dict: Request, response and the per-request DataLoaders
+        """
+        return {
+            "request": request,
+            "response": response,
+            "user_loader": DataLoader(load_fn=load_users),
+            "posts_loader": DataLoader(load_fn=load_user_posts)
+        }
+
+
+class PersistedQueryError(Exception):
+    """
+    A persisted query request that cannot be executed.
+
+    Raised by resolve_persisted_query and turned into a GraphQL error
+    response by BlogGraphQLView.dispatch_request.
+
+    Attributes:
+        message: Error message, e.g. "PersistedQueryNotFound"
+        code: Error code for `extensions.code`, e.g. "PERSISTED_QUERY_NOT_FOUND"
+    """
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+    def response_body(self) -> bytes:
+        """
+        Build the JSON body of the error response.
+
+        Returns:
+            bytes: {"errors": [{"message": ..., "extensions": {"code": ...}}]}
+        """
+        return orjson.dumps({
+            "errors": [{"message": self.message, "extensions": {"code": self.code}}]
+        })
+
+
+def resolve_persisted_query(request_data) -> None:
+    """
+    Fill in (or remember) the query text of an APQ request.
+
+    Requests without the `persistedQuery` extension are left untouched.
+
+    Args:
+        request_data: Parsed GraphQL request (changed in place)
+
+    Raises:
+        PersistedQueryError: Unknown hash, or hash that does not match the query
+    """
+    persisted_query = (request_data.extensions or {}).get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return
+
+    query_hash = persisted_query.get("sha256Hash")
+    if not isinstance(query_hash, str):
+        raise PersistedQueryError("PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED")
+
+    if request_data.query is None:
+        # Hash only: look up the query sent earlier
+        with _persisted_queries_lock:
+            query = _persisted_queries.get(query_hash)
+            if query is not None:
+                # Mark as recently used
+                _persisted_queries.move_to_end(query_hash)
+
+        if query is None:
+            raise PersistedQueryError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+        request_data.query = query
+        return
+
+    # Hash and query: make sure they belong together before storing
+    if hashlib.sha256(request_data.query.encode()).hexdigest() != query_hash:
+        raise PersistedQueryError("provided sha does not match query", "BAD_REQUEST")
+
+    # Only real GraphQL documents are stored. Anything else is still
+    # executed, so Strawberry reports the syntax error as usual.
+    try:
+        parse(request_data.query)
+    except GraphQLError:
+        return
+
+    with _persisted_queries_lock:
+        _persisted_queries[query_hash] = request_data.query
+        _persisted_queries.move_to_end(query_hash)
+
+        if len(_persisted_queries) > MAX_PERSISTED_QUERIES:
+            # Drop the least recently used query
+            _persisted_queries.popitem(last=False)
+
+
+def _is_introspection_only(query: str) -> bool:
+    """
+    Check whether a query only asks about the schema itself.
+
+    True when every operation is a query and selects only fields that
+    start with "__" (e.g. __schema, __type), so the result depends on
+    nothing but the schema.
+
+    Args:
+        query: GraphQL query text
+
+    Returns:
+        bool: Whether the query is a pure introspection query
+    """
+    try:
+        document = parse(query)
+    except GraphQLError:
+        return False
+
+    operations = [
+        definition for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    if not operations:
+        return False
+
+    for operation in operations:
+        if operation.operation.value != "query":
+            return False
+
+        for selection in operation.selection_set.selections:
+            # Fragments at the top level could select regular fields
+            if not isinstance(selection, FieldNode):
+                return False
+            if not selection.name.value.startswith("__"):
+                return False
+
+    return True
+
+
+def introspection_response(query: str) -> Optional[bytes]:
+    """
+    Return the cached JSON response for an introspection query.
+
+    The first time an introspection query is seen it is executed once
+    and its response stored. Any other query returns None and is
+    handled by Strawberry as usual.
+
+    Args:
+        query: GraphQL query text
+
+    Returns:
+        bytes: Complete JSON response body, or None if not an
+        introspection query
+    """
+    # Cheap text check first: almost every query is a regular one
+    if _INTROSPECTION_FIELD.search(query) is None:
+        return None
+
+    query_hash = hashlib.sha256(query.encode()).hexdigest()
+
+    cached_response = _introspection_responses.get(query_hash)
+    if cached_response is not None:
+        return cached_response
+
+    if not _is_introspection_only(query):
+        # e.g. a regular query that also asks for __type(name: ...)
+        return None
+
+    if len(_introspection_responses) >= MAX_INTROSPECTION_RESPONSES:
+        return None
+
+    # Introspection fields are answered by graphql-core from the schema
+    # alone, so no context or resolvers are needed here
+    result = graphql_sync(schema._schema, query)
+    if result.errors:
+        # e.g. a typo in the query: let Strawberry report the errors
+        return None
+
+    response = orjson.dumps({"data": result.data})
+    _introspection_responses[query_hash] = response
+    return response
+
+
+def warm_introspection_cache() -> None:
+    """
+    Compute the response to the standard introspection query in advance.
+
+    Called once at startup (see app.create_app), so even the first
+    client asking for the schema gets the stored answer.
+    """
+    introspection_response(get_introspection_query())
@@ -0,0 +1,65 @@
+"""
+Gunicorn Configuration (production server)
+
+`python app.py` starts Flask's built-in development server, which is meant
+for local testing only. For serving real traffic, run the app with Gunicorn
+using this configuration file:
+
+    gunicorn -c gunicorn.conf.py 'app:create_app()'
+
+Setup:
+    pip install gunicorn
+
+How it works:
+- Several worker processes run in parallel (one request does not block
+  all the others)
+- Each worker runs several threads. SQLite releases Python's GIL while a
+  query runs, so threads of one worker really do query in parallel
+- The app is loaded once before the workers are forked (preload_app),
+  so workers start faster and share memory
+
+Why threads and not gevent?
+- The GraphQL endpoint uses async resolvers (DataLoader). Flask runs them
+  in an asyncio event loop per request, and asyncio cannot share one OS
+  thread between several gevent greenlets
+- SQLite calls run in C and never yield to gevent, so greenlets would not
+  make database access any more concurrent
+"""
+
+import multiprocessing
+
+from database import POOL_SIZE, close_pool
+
+
+# Address and port (same as the development server)
+bind = '0.0.0.0:5001'
+
+# Number of worker processes
+# (2 x CPU cores) + 1 is Gunicorn's recommended starting point
+workers = multiprocessing.cpu_count() * 2 + 1
+
+# Serve requests with a thread pool inside every worker
+worker_class = 'gthread'
+
+# One thread per pooled database connection, so no thread
+# has to wait for a free connection
+threads = POOL_SIZE
+
+# Load the app in the master process before forking the workers.
+# Modules such as Strawberry and the GraphQL schema are imported only once
+# and the workers share that memory (copy-on-write) instead of each
+# importing them again. Set ENABLE_GRAPHQL=0 to skip Strawberry entirely.
+# The database connection pool is only created on the first query,
+# so every worker still opens its own SQLite connections.
+preload_app = True
+
+
+def post_fork(server, worker):
+    """
+    Gunicorn hook, runs in every worker right after it is forked.
+
+    SQLite connections must not be shared between processes. Normally the
+    master never opens the pool, but if it did (e.g. while preloading),
+    the worker forgets the inherited pool and opens its own on first query.
+    """
+    close_pool(close_connections=False)
@@ -0,0 +1,72 @@
+"""
+Fast JSON Provider for Flask
+
+This module plugs the `orjson` library into Flask, so that `jsonify()`
+and `request.get_json()` use it instead of Python's built-in `json` module.
+
+Why orjson?
+- Written in Rust, serializes several times faster than `json`
+- Produces UTF-8 bytes directly, so responses skip a str -> bytes step
+- Understands datetime and dataclass objects out of the box
+
+Setup:
+    pip install orjson
+
+Note: keys keep their insertion order instead of being sorted
+alphabetically like Flask's default provider does.
+"""
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class ORJSONProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Usage (in create_app):
+        app.json = ORJSONProvider(app)
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        """
+        Serialize an object to a JSON string.
+
+        Extra keyword arguments (e.g. indent) are not supported by orjson
+        and are ignored.
+
+        Args:
+            obj: Data to serialize
+
+        Returns:
+            str: JSON text
+        """
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Parse JSON text or UTF-8 bytes.
+
+        Args:
+            s: JSON text (str or bytes)
+
+        Returns:
+            The parsed Python object
+        """
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        Build a JSON response (this is what `jsonify()` calls).
+
+        The orjson bytes are used as the body directly, without
+        decoding them to a string first.
+
+        Returns:
+            flask.Response with the application/json mimetype
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj),
+            mimetype='application/json'
+        )
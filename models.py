@@ -9,14 +9,18 @@ Why dataclasses?
 - Automatic __init__, __repr__, and __eq__ methods
 - Type hints for better code clarity
 - Easy to convert to JSON for API responses
+
+slots=True stores the fields in fixed slots instead of a per-object
+__dict__: every object uses less memory and attribute access is faster.
+The catch: no attributes other than the declared fields can be added.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     User model representing a blog author.
@@ -34,13 +38,22 @@ class User:
         """
         Convert user object to dictionary for JSON serialization.
 
+        The dictionary is written out by hand instead of using
+        dataclasses.asdict, which copies every field recursively. A new
+        dictionary is built on every call, so callers may change it freely.
+        (The encoded GET /users body is cached in users_cache instead.)
+
         Returns:
             dict: Dictionary representation of the user
         """
-        return asdict(self)
+        return {
+            'id': self.id,
+            'name': self.name,
+            'email': self.email
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """
     Post model representing a blog post.
@@ -57,7 +70,7 @@ class Post:
     title: str
     content: str
     author_id: int
-    created_at: str  # Stored as ISO format string (e.g., "2025-10-03T10:30:00")
+    created_at: str  # ISO format string in UTC (e.g., "2025-10-03T10:30:00Z")
     author: Optional[User] = None  # Populated when we join with users table
 
     def to_dict(self) -> dict:
@@ -79,13 +92,14 @@ class Post:
         }
 
         # Include author information if available
-        if self.author:
-            post_dict['author'] = self.author.to_dict()
+        author = self.author
+        if author is not None:
+            post_dict['author'] = author.to_dict()
 
         return post_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedResponse:
     """
     Wrapper for paginated API responses.
@@ -93,31 +107,50 @@ class PaginatedResponse:
     This provides consistent structure for paginated data across all endpoints.
 
     Attributes:
-        data: List of items (posts or users)
+        data: List of items (Post/User objects or database rows)
         page: Current page number
         limit: Number of items per page
         total: Total number of items available
         total_pages: Total number of pages
+        next_cursor: Cursor for fetching the next page (None on the last page)
     """
     data: List
     page: int
     limit: int
     total: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
     def to_dict(self) -> dict:
         """
         Convert paginated response to dictionary.
 
+        Every item in `data` must have a to_dict() method (Post, User).
+        Database rows from get_posts are converted with
+        database.posts_to_dicts plus pagination_to_dict() instead.
+
         Returns:
             dict: Dictionary with pagination metadata and data
         """
         return {
-            'data': [item.to_dict() if hasattr(item, 'to_dict') else item for item in self.data],
-            'pagination': {
-                'page': self.page,
-                'limit': self.limit,
-                'total': self.total,
-                'total_pages': self.total_pages
-            }
+            'data': [item.to_dict() for item in self.data],
+            'pagination': self.pagination_to_dict()
+        }
+
+    def pagination_to_dict(self) -> dict:
+        """
+        Convert only the pagination metadata to a dictionary.
+
+        Useful when the items are converted separately
+        (e.g. post rows with database.posts_to_dicts).
+
+        Returns:
+            dict: Dictionary with page, limit, total, total_pages, next_cursor
+        """
+        return {
+            'page': self.page,
+            'limit': self.limit,
+            'total': self.total,
+            'total_pages': self.total_pages,
+            'next_cursor': self.next_cursor
         }
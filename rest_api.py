@@ -10,6 +10,8 @@ Endpoints:
 - GET /users - List all users
 - GET /users/<id> - Get a single user
 - GET /users/<id>/posts - Get posts by a specific user
+- GET /health - Check if the API is running
+- GET /health/cache - Hit/miss counters of the in-memory caches
 
 Design principles:
 - Consistent JSON response format
@@ -18,14 +20,84 @@ Design principles:
 - Include helpful error messages
 """
 
-from flask import Blueprint, request, jsonify
-from database import get_posts, get_user_by_id, get_user_posts, get_all_users, get_post_by_id
+import hashlib
+from datetime import datetime
+
+import orjson
+from flask import Blueprint, Response, request, stream_with_context
+from database import get_posts, get_user_by_id, get_user_with_posts, get_all_users, get_post_by_id, posts_to_dicts, iter_posts
+from cache import posts_cache, users_cache
 
 
 # Create a Blueprint for REST API routes
 # This allows us to organize routes separately from the main app
 rest_api_bp = Blueprint('rest_api', __name__)
 
+def ojsonify(payload, status: int = 200) -> Response:
+    """
+    Build a JSON response, encoded with orjson.
+
+    Works like `jsonify(payload), status`, but encodes directly with
+    orjson and skips the extra work Flask's jsonify does to accept
+    several argument styles.
+
+    Models are passed in as to_dict() results, not as dataclasses:
+    orjson would write a post without a loaded author as "author": null,
+    while Post.to_dict() leaves the key out.
+
+    Args:
+        payload: Data to send (dicts, lists, strings, numbers, ...)
+        status: HTTP status code (default: 200)
+
+    Returns:
+        flask.Response with the application/json mimetype
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+
+# Body of the /health response, encoded once (it never changes)
+_HEALTH_BODY = orjson.dumps({
+    'status': 'healthy',
+    'message': 'REST API is running'
+})
+
+
+# Highest page number accepted by GET /posts.
+# Far beyond any real listing, but small enough that the page number and
+# the row offset computed from it stay valid 64-bit integers for SQLite
+# and orjson (larger values used to end in a 500 error).
+MAX_PAGE = 1_000_000
+
+
+# Post listings with at least this many posts per page are streamed
+# (sent piece by piece while they are read from the database).
+# Smaller pages are built in one go, which also lets them be cached.
+STREAM_MIN_LIMIT = 50
+
+
+def _stream_posts_json(stream):
+    """
+    Encode a post listing as JSON piece by piece.
+
+    Produces exactly the same JSON document as the non-streamed /posts
+    response: {"data": [...], "pagination": {...}}
+
+    Args:
+        stream: PostStream returned by database.iter_posts
+
+    Yields:
+        bytes: Parts of the JSON document
+    """
+    yield b'{"data":['
+
+    separator = b''
+    for post in stream:
+        yield separator + orjson.dumps(post)
+        separator = b','
+
+    # The pagination info is known once every row has been read
+    yield b'],"pagination":' + orjson.dumps(stream.pagination) + b'}'
+
 
 @rest_api_bp.route('/posts', methods=['GET'])
 def list_posts():
@@ -33,11 +105,13 @@ def list_posts():
     GET /posts - Retrieve a list of posts
 
     Query parameters:
-        page (int): Page number (default: 1)
+        page (int): Page number (default: 1, at most MAX_PAGE)
         limit (int): Number of posts per page (default: 10)
         sort (str): Sort field - 'created_at' or 'title' (default: 'created_at')
         order (str): Sort order - 'asc' or 'desc' (default: 'desc')
         search (str): Search keyword for title or content (optional)
+        after (str): Cursor from pagination.next_cursor (optional).
+            Fetches the next page by seeking instead of using page numbers
 
     Returns:
         JSON response with posts and pagination metadata
@@ -45,36 +119,88 @@ def list_posts():
     Example:
         GET /posts?page=1&limit=10&sort=created_at&order=desc
         GET /posts?search=python
+        GET /posts?limit=10&after=<next_cursor from the previous page>
     """
     # Extract query parameters with default values
-    page = request.args.get('page', 1, type=int)
-    limit = request.args.get('limit', 10, type=int)
-    sort_by = request.args.get('sort', 'created_at', type=str)
-    order = request.args.get('order', 'desc', type=str)
-    search = request.args.get('search', None, type=str)
+    # Plain lookups + int() are cheaper than request.args.get(..., type=int),
+    # which converts each value separately with its own error handling.
+    # A missing or empty value falls back to the default.
+    args = request.args
+    try:
+        page = int(args.get('page') or 1)
+        limit = int(args.get('limit') or 10)
+    except ValueError:
+        return ojsonify({
+            'error': 'Page and limit must be whole numbers'
+        }, 400)
+
+    sort_by = args.get('sort') or 'created_at'
+    order = args.get('order') or 'desc'
+    search = args.get('search')
+    after = args.get('after')
 
     # Validate pagination parameters
     if page < 1:
-        return jsonify({
+        return ojsonify({
             'error': 'Page number must be greater than 0'
-        }), 400
+        }, 400)
+
+    if page > MAX_PAGE:
+        return ojsonify({
+            'error': f'Page number must not be greater than {MAX_PAGE}'
+        }, 400)
 
     if limit < 1 or limit > 100:
-        return jsonify({
+        return ojsonify({
             'error': 'Limit must be between 1 and 100'
-        }), 400
+        }, 400)
+
+    # Large pages: stream the posts while they are read from the database,
+    # so the client receives the first posts sooner and the server never
+    # holds the whole page (rows + JSON text) in memory at once
+    if limit >= STREAM_MIN_LIMIT:
+        try:
+            stream = iter_posts(
+                page=page,
+                limit=limit,
+                sort_by=sort_by,
+                order=order,
+                search=search,
+                after=after
+            )
+        except ValueError:
+            # Raised when the `after` cursor cannot be decoded
+            return ojsonify({
+                'error': 'Invalid cursor'
+            }, 400)
+
+        return Response(
+            stream_with_context(_stream_posts_json(stream)),
+            mimetype='application/json'
+        )
 
     # Get posts from database
-    paginated_response = get_posts(
-        page=page,
-        limit=limit,
-        sort_by=sort_by,
-        order=order,
-        search=search
-    )
+    try:
+        paginated_response = get_posts(
+            page=page,
+            limit=limit,
+            sort_by=sort_by,
+            order=order,
+            search=search,
+            after=after
+        )
+    except ValueError:
+        # Raised when the `after` cursor cannot be decoded
+        return ojsonify({
+            'error': 'Invalid cursor'
+        }, 400)
 
     # Return JSON response
-    return jsonify(paginated_response.to_dict()), 200
+    # Rows are converted straight to dicts (no User/Post objects per row)
+    return ojsonify({
+        'data': posts_to_dicts(paginated_response.data),
+        'pagination': paginated_response.pagination_to_dict()
+    }, 200)
 
 
 @rest_api_bp.route('/posts/<int:post_id>', methods=['GET'])
@@ -86,7 +212,8 @@ def get_post(post_id):
         post_id (int): ID of the post to retrieve
 
     Returns:
-        JSON response with post data
+        JSON response with post data, or 304 Not Modified (no body)
+        when the If-None-Match header matches the post's ETag
 
     Example:
         GET /posts/1
@@ -94,11 +221,26 @@ def get_post(post_id):
     post = get_post_by_id(post_id)
 
     if not post:
-        return jsonify({
+        return ojsonify({
             'error': f'Post with ID {post_id} not found'
-        }), 404
+        }, 404)
+
+    # Posts are never edited, so the ID and creation time identify this
+    # exact version of the post. The ETag is weak ("W/"): it stands for
+    # the post, not for the exact bytes of the response.
+    created_hash = hashlib.blake2b(post.created_at.encode(), digest_size=8).hexdigest()
+    etag = f'{post.id}-{created_hash}'
+
+    # The client already has this post: answer 304 without a body
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = ojsonify(post.to_dict(), 200)
 
-    return jsonify(post.to_dict()), 200
+    response.set_etag(etag, weak=True)
+    response.last_modified = datetime.fromisoformat(post.created_at)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
 
 
 @rest_api_bp.route('/users', methods=['GET'])
@@ -107,20 +249,45 @@ def list_users():
     GET /users - Retrieve a list of all users
 
     Returns:
-        JSON response with array of users
+        JSON response with array of users, or 304 Not Modified (no body)
+        when the If-None-Match header matches the current ETag
 
     Example:
         GET /users
     """
-    users = get_all_users()
+    # The encoded response and its ETag are cached next to the users
+    # themselves (same lifetime), so repeated requests skip building and
+    # encoding. users_cache.invalidate() drops this entry as well.
+    cache_key = users_cache.make_key('all_users_json')
+    cached = users_cache.get(cache_key)
+
+    if cached is None:
+        users = get_all_users()
+
+        # Convert User objects to dictionaries
+        users_data = [user.to_dict() for user in users]
+
+        body = orjson.dumps({
+            'data': users_data,
+            'total': len(users_data)
+        })
 
-    # Convert User objects to dictionaries
-    users_data = [user.to_dict() for user in users]
+        # The ETag is a short fingerprint of the body: it only changes
+        # when the list of users changes
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        cached = (body, etag)
+        users_cache.set(cache_key, cached)
 
-    return jsonify({
-        'data': users_data,
-        'total': len(users_data)
-    }), 200
+    body, etag = cached
+
+    # The client already has this exact list: answer 304 without a body
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+
+    response.set_etag(etag)
+    return response
 
 
 @rest_api_bp.route('/users/<int:user_id>', methods=['GET'])
@@ -140,11 +307,11 @@ def get_user(user_id):
     user = get_user_by_id(user_id)
 
     if not user:
-        return jsonify({
+        return ojsonify({
             'error': f'User with ID {user_id} not found'
-        }), 404
+        }, 404)
 
-    return jsonify(user.to_dict()), 200
+    return ojsonify(user.to_dict(), 200)
 
 
 @rest_api_bp.route('/users/<int:user_id>/posts', methods=['GET'])
@@ -164,34 +331,39 @@ def get_user_posts_endpoint(user_id):
     Example:
         GET /users/1/posts?limit=3
     """
-    # First, verify the user exists
-    user = get_user_by_id(user_id)
-
-    if not user:
-        return jsonify({
-            'error': f'User with ID {user_id} not found'
-        }), 404
-
     # Get limit from query parameters
     limit = request.args.get('limit', 3, type=int)
 
     # Validate limit
     if limit < 1 or limit > 100:
-        return jsonify({
+        # An unknown user is still reported as 404 first
+        if get_user_by_id(user_id) is None:
+            return ojsonify({
+                'error': f'User with ID {user_id} not found'
+            }, 404)
+
+        return ojsonify({
             'error': 'Limit must be between 1 and 100'
-        }), 400
+        }, 400)
+
+    # Get the user and their posts with a single query
+    user_with_posts = get_user_with_posts(user_id, limit)
 
-    # Get user's posts
-    posts = get_user_posts(user_id, limit)
+    if user_with_posts is None:
+        return ojsonify({
+            'error': f'User with ID {user_id} not found'
+        }, 404)
+
+    user, posts = user_with_posts
 
     # Convert Post objects to dictionaries
     posts_data = [post.to_dict() for post in posts]
 
-    return jsonify({
+    return ojsonify({
         'user': user.to_dict(),
         'posts': posts_data,
         'total': len(posts_data)
-    }), 200
+    }, 200)
 
 
 # Health check endpoint
@@ -205,7 +377,23 @@ def health_check():
     Returns:
         JSON response with status message
     """
-    return jsonify({
-        'status': 'healthy',
-        'message': 'REST API is running'
-    }), 200
+    return Response(_HEALTH_BODY, mimetype='application/json')
+
+
+@rest_api_bp.route('/health/cache', methods=['GET'])
+def cache_stats():
+    """
+    GET /health/cache - Show how well the in-memory caches work
+
+    A low hit count compared to misses means the cache rarely helps (e.g.
+    the TTL is too short for the traffic). Every Gunicorn worker process
+    has its own caches, so the numbers are those of the worker that
+    answered the request.
+
+    Returns:
+        JSON response with hits, misses and stored entries per cache
+    """
+    return ojsonify({
+        'posts': posts_cache.stats(),
+        'users': users_cache.stats()
+    }, 200)
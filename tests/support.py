@@ -0,0 +1,59 @@
+"""
+Shared helpers for the tests.
+
+Every test module builds its own sample database in a temporary
+directory, so running the tests never touches blog.db.
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+
+import database
+import init_db
+from cache import posts_cache, users_cache
+
+
+def create_test_database() -> tempfile.TemporaryDirectory:
+    """
+    Create and seed a fresh database, and point the app at it.
+
+    Returns:
+        The temporary directory holding the database. Pass it to
+        remove_test_database when the tests are done.
+    """
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, 'blog.db')
+
+    init_db.DATABASE_NAME = path
+    database.DATABASE_NAME = path
+
+    # init_db prints a progress line for every step
+    with contextlib.redirect_stdout(io.StringIO()):
+        connection = init_db.create_database()
+        init_db.create_tables(connection)
+        user_ids = init_db.seed_users(connection)
+        init_db.seed_posts(connection, user_ids)
+        connection.close()
+
+    _reset()
+    return directory
+
+
+def remove_test_database(directory: tempfile.TemporaryDirectory) -> None:
+    """
+    Close the pooled connections and delete the test database.
+
+    Args:
+        directory: Directory returned by create_test_database
+    """
+    _reset()
+    directory.cleanup()
+
+
+def _reset() -> None:
+    """Forget pooled connections and cached results from other tests."""
+    database.close_pool()
+    posts_cache.invalidate()
+    users_cache.invalidate()
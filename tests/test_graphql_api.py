@@ -0,0 +1,141 @@
+"""
+Tests for the GraphQL endpoint (graphql_api.py).
+"""
+
+import hashlib
+import unittest
+from unittest import mock
+
+import orjson
+
+import graphql_api
+from app import create_app
+from tests.support import create_test_database, remove_test_database
+
+
+def setUpModule():
+    global _database
+    _database = create_test_database()
+
+
+def tearDownModule():
+    remove_test_database(_database)
+
+
+class PersistedQueryTest(unittest.TestCase):
+    """Automatic Persisted Queries, as sent by Apollo Client."""
+
+    def setUp(self):
+        self.client = create_app().test_client()
+
+    def post(self, body):
+        response = self.client.post('/graphql', json=body)
+        # Errors are reported in a normal GraphQL response, never as an
+        # HTTP error: Apollo would then stop using persisted queries
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/json')
+        return orjson.loads(response.data)
+
+    def test_miss_register_hit(self):
+        query = '{ users { id name } }'
+        extensions = {'persistedQuery': {
+            'version': 1,
+            'sha256Hash': hashlib.sha256(query.encode()).hexdigest()
+        }}
+
+        # 1. Hash only, not known yet: the client is asked for the query
+        missed = self.post({'extensions': extensions})
+        self.assertEqual(missed['errors'][0]['message'], 'PersistedQueryNotFound')
+        self.assertEqual(
+            missed['errors'][0]['extensions']['code'],
+            'PERSISTED_QUERY_NOT_FOUND'
+        )
+
+        # 2. Query and hash: executed and stored
+        registered = self.post({'query': query, 'extensions': extensions})
+        self.assertNotIn('errors', registered)
+
+        # 3. Hash only again: the stored query is executed
+        hit = self.post({'extensions': extensions})
+        self.assertEqual(hit, registered)
+
+    def register(self, query):
+        """Send a query with its hash, as Apollo does after a miss."""
+        query_hash = hashlib.sha256(query.encode()).hexdigest()
+        self.post({
+            'query': query,
+            'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': query_hash}}
+        })
+        return query_hash
+
+    # A small store keeps these tests fast
+    @mock.patch.object(graphql_api, 'MAX_PERSISTED_QUERIES', 8)
+    def test_store_full_still_accepts_new_queries(self):
+        first_hash = self.register('query First { users { id } }')
+
+        # Fill the store past its limit with one-off queries
+        for number in range(graphql_api.MAX_PERSISTED_QUERIES + 5):
+            self.register(f'query Filler{number} {{ users {{ id }} }}')
+
+        self.assertEqual(len(graphql_api._persisted_queries), graphql_api.MAX_PERSISTED_QUERIES)
+        # The oldest query was dropped to make room
+        self.assertNotIn(first_hash, graphql_api._persisted_queries)
+
+        new_hash = self.register('query Latest { users { name } }')
+        hit = self.post({'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': new_hash}}})
+        self.assertNotIn('errors', hit)
+
+    @mock.patch.object(graphql_api, 'MAX_PERSISTED_QUERIES', 8)
+    def test_recently_used_query_is_kept(self):
+        kept_hash = self.register('query Kept { users { email } }')
+
+        for number in range(graphql_api.MAX_PERSISTED_QUERIES + 5):
+            self.register(f'query Other{number} {{ users {{ id }} }}')
+            # The client keeps sending this query by hash only
+            self.post({'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': kept_hash}}})
+
+        self.assertIn(kept_hash, graphql_api._persisted_queries)
+
+    def test_invalid_query_is_not_stored(self):
+        query_hash = self.register('this is not graphql')
+        self.assertNotIn(query_hash, graphql_api._persisted_queries)
+
+    def test_hash_mismatch(self):
+        result = self.post({
+            'query': '{ users { id } }',
+            'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': '0' * 64}}
+        })
+        self.assertEqual(result['errors'][0]['message'], 'provided sha does not match query')
+
+    def test_missing_hash(self):
+        result = self.post({
+            'query': '{ users { id } }',
+            'extensions': {'persistedQuery': {'version': 1}}
+        })
+        self.assertEqual(
+            result['errors'][0]['extensions']['code'],
+            'PERSISTED_QUERY_NOT_SUPPORTED'
+        )
+
+
+class IntrospectionCacheTest(unittest.TestCase):
+    """Introspection answers served from memory (introspection_response)."""
+
+    def test_regular_query_is_not_parsed(self):
+        with mock.patch.object(graphql_api, '_is_introspection_only') as check:
+            self.assertIsNone(graphql_api.introspection_response('{ users { __typename id } }'))
+        check.assert_not_called()
+
+    def test_introspection_query_is_cached(self):
+        query = '{ __type(name: "User") { name } }'
+        first = graphql_api.introspection_response(query)
+        self.assertEqual(orjson.loads(first), {'data': {'__type': {'name': 'User'}}})
+        self.assertIs(graphql_api.introspection_response(query), first)
+
+    def test_mixed_query_is_not_cached(self):
+        query = '{ __type(name: "User") { name } users { id } }'
+        self.assertIsNone(graphql_api.introspection_response(query))
+
+
+if __name__ == '__main__':
+    unittest.main()
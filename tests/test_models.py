@@ -0,0 +1,43 @@
+"""
+Tests for the data models (models.py).
+"""
+
+import dataclasses
+import unittest
+
+from models import Post, User
+
+
+class UserTest(unittest.TestCase):
+
+    def test_to_dict_follows_changes(self):
+        user = User(id=1, name='a', email='a@example.com')
+        user.name = 'b'
+        self.assertEqual(user.to_dict()['name'], 'b')
+
+    def test_to_dict_returns_a_new_dict(self):
+        user = User(id=1, name='a', email='a@example.com')
+        user.to_dict()['name'] = 'changed'
+        self.assertEqual(user.to_dict()['name'], 'a')
+
+    def test_asdict_has_only_the_columns(self):
+        user = User(id=1, name='a', email='a@example.com')
+        self.assertEqual(
+            dataclasses.asdict(user),
+            {'id': 1, 'name': 'a', 'email': 'a@example.com'}
+        )
+
+
+class PostTest(unittest.TestCase):
+
+    def test_author_included_only_when_loaded(self):
+        post = Post(id=1, title='t', content='c', author_id=1,
+                    created_at='2025-10-03T10:30:00Z')
+        self.assertNotIn('author', post.to_dict())
+
+        post.author = User(id=1, name='a', email='a@example.com')
+        self.assertEqual(post.to_dict()['author']['name'], 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests for the post listing (database.get_posts) and its in-memory snapshot.
+"""
+
+import unittest
+from unittest import mock
+
+import database
+from cache import posts_cache
+from database import get_posts, posts_to_dicts
+from tests.support import create_test_database, remove_test_database
+
+
+def setUpModule():
+    global _database
+    _database = create_test_database()
+
+
+def tearDownModule():
+    remove_test_database(_database)
+
+
+def listing(**kwargs):
+    """Posts and pagination of one get_posts call, as the API sends them."""
+    response = get_posts(**kwargs)
+    return posts_to_dicts(response.data), response.pagination_to_dict()
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        posts_cache.invalidate()
+
+    def test_same_pages_as_sql(self):
+        for sort_by in ('created_at', 'title', 'id'):
+            for order in ('asc', 'desc'):
+                for limit in (1, 4, 10):
+                    for page in (1, 2, 4):
+                        kwargs = dict(page=page, limit=limit, sort_by=sort_by, order=order)
+                        with self.subTest(**kwargs):
+                            from_snapshot = listing(**kwargs)
+
+                            posts_cache.invalidate()
+                            with mock.patch.object(database, 'SNAPSHOT_MAX_POSTS', 0):
+                                from_sql = listing(**kwargs)
+
+                            self.assertEqual(from_snapshot, from_sql)
+                            posts_cache.invalidate()
+
+    def test_snapshot_pages_are_not_cached_again(self):
+        get_posts(page=1, limit=5)
+        key = posts_cache.make_key(1, 5, 'created_at', 'DESC', None, None)
+        self.assertIsNone(posts_cache.get(key))
+
+    def test_rebuild_runs_once(self):
+        # While one thread rebuilds, other requests fall back to SQL
+        # instead of reading every post themselves
+        with database._snapshot_lock:
+            self.assertIsNone(database._load_posts_snapshot())
+            self.assertEqual(len(get_posts(page=1, limit=5).data), 5)
+
+        self.assertIsNotNone(database._load_posts_snapshot())
+
+
+if __name__ == '__main__':
+    unittest.main()
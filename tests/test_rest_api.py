@@ -0,0 +1,73 @@
+"""
+Tests for the REST endpoints (rest_api.py).
+"""
+
+import unittest
+
+from app import create_app
+from rest_api import MAX_PAGE
+from tests.support import create_test_database, remove_test_database
+
+
+def setUpModule():
+    global _database
+    _database = create_test_database()
+
+
+def tearDownModule():
+    remove_test_database(_database)
+
+
+class ListPostsParametersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app().test_client()
+
+    def assert_bad_request(self, query_string):
+        response = self.client.get('/posts' + query_string)
+        self.assertEqual(response.status_code, 400, query_string)
+        self.assertIn('error', response.get_json())
+
+    def test_defaults(self):
+        response = self.client.get('/posts?page=&limit=')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['pagination']['limit'], 10)
+
+    def test_not_a_number(self):
+        self.assert_bad_request('?page=abc')
+        self.assert_bad_request('?limit=1.5')
+
+    def test_out_of_range(self):
+        self.assert_bad_request('?page=0')
+        self.assert_bad_request('?limit=0')
+        self.assert_bad_request('?limit=101')
+
+    def test_huge_page(self):
+        self.assert_bad_request(f'?page={MAX_PAGE + 1}')
+        self.assert_bad_request('?page=999999999999999999999')
+        self.assert_bad_request('?page=999999999999999999999&search=python')
+        self.assert_bad_request('?page=999999999999999999999&limit=60')
+
+    def test_last_allowed_page_is_empty(self):
+        for query_string in (f'?page={MAX_PAGE}&limit=100', f'?page={MAX_PAGE}&search=python'):
+            response = self.client.get('/posts' + query_string)
+            self.assertEqual(response.status_code, 200, query_string)
+            self.assertEqual(response.get_json()['data'], [])
+
+
+class CacheStatsTest(unittest.TestCase):
+
+    def test_counts_hits_and_misses(self):
+        client = create_app().test_client()
+        client.get('/users/1')
+        client.get('/users/1')
+
+        stats = client.get('/health/cache').get_json()
+        self.assertEqual(set(stats), {'posts', 'users'})
+        # The second request found the user in users_cache
+        self.assertGreater(stats['users']['hits'], 0)
+        self.assertGreater(stats['users']['entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for the full-text post search (database.get_posts with `search`).
+"""
+
+import unittest
+from unittest import mock
+
+import orjson
+
+import database
+from app import create_app
+from database import borrow_connection, get_posts, iter_posts
+from tests.support import create_test_database, remove_test_database
+
+
+def setUpModule():
+    global _database
+    _database = create_test_database()
+
+
+def tearDownModule():
+    remove_test_database(_database)
+
+
+def search_titles(keyword):
+    """Titles of every post matching `keyword`."""
+    response = get_posts(limit=100, search=keyword)
+    return {row['title'] for row in response.data}
+
+
+def like_titles(keyword):
+    """Titles found by the old `LIKE '%keyword%'` search, for comparison."""
+    pattern = f'%{keyword}%'
+    with borrow_connection() as connection:
+        rows = connection.execute(
+            'SELECT title FROM posts WHERE title LIKE ? OR content LIKE ?',
+            (pattern, pattern)
+        ).fetchall()
+    return {row[0] for row in rows}
+
+
+class SearchTest(unittest.TestCase):
+
+    def test_full_word(self):
+        self.assertIn('Getting Started with Python Web Development', search_titles('python'))
+
+    def test_partial_word(self):
+        # The start of a word is enough, also when it is longer than the
+        # word's stem ("organizing" -> "organ" with a stemming tokenizer)
+        self.assertEqual(
+            search_titles('organiz'),
+            {'How to Structure Your Python Projects'}
+        )
+        for keyword in ('optimiz', 'maintainab', 'scalabilit'):
+            with self.subTest(keyword=keyword):
+                self.assertEqual(search_titles(keyword), like_titles(keyword))
+        self.assertIn('Introduction to GraphQL: A Modern Approach', search_titles('graph'))
+
+    def test_total_counts_every_match(self):
+        response = get_posts(limit=1, search='graphql')
+        self.assertEqual(response.total, len(search_titles('graphql')))
+        self.assertGreater(response.total, 1)
+
+    def test_operators_are_plain_text(self):
+        # FTS5 syntax typed by a user must not raise an error
+        self.assertEqual(search_titles('"NOT OR*'), set())
+
+        # NUL cannot be used inside an FTS5 phrase: it is dropped, and a
+        # keyword with nothing else left matches no posts
+        self.assertEqual(search_titles('\x00'), set())
+        self.assertEqual(search_titles('pyth\x00on'), search_titles('python'))
+
+        client = create_app().test_client()
+        # Buffered (small pages) and streamed (limit >= 50) responses
+        for limit in (10, 60):
+            with self.subTest(limit=limit):
+                response = client.get(f'/posts?search=%00&limit={limit}')
+                self.assertEqual(response.status_code, 200)
+                body = orjson.loads(response.data)
+                self.assertEqual(body['data'], [])
+                self.assertEqual(body['pagination']['total'], 0)
+
+    def test_fts_error_gives_empty_page(self):
+        # Should a keyword still reach FTS5 in a form it rejects, both the
+        # buffered and the streamed listing answer with an empty page
+        with mock.patch.object(database, '_to_fts_query', return_value='"\x00"*'):
+            self.assertEqual(get_posts(limit=10, search='broken').data, [])
+
+            stream = iter_posts(limit=60, search='broken')
+            self.assertEqual(list(stream), [])
+            self.assertEqual(stream.pagination['total'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()